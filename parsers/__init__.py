@@ -16,6 +16,27 @@ from .turkey_parser import TurkeyParser
 from .pakistan_parser import PakistanParser
 from .parser_factory import ParserFactory
 
+# 국가별 파서 레지스트리 (빈 서브클래스 대신 dict 기반 디스패치)
+PARSERS = {
+    'usa': USAParser,
+    'eu': EUParser,
+    'malaysia': MalaysiaParser,
+    'australia': AustraliaParser,
+    'pakistan': PakistanParser,
+    'brazil': BrazilParser,
+    'india': IndiaParser,
+    'canada': CanadaParser,
+    'turkey': TurkeyParser,
+    'default': DefaultTextParser,
+}
+
+
+def get_parser(country: str, client):
+    """레지스트리에서 국가명으로 파서 인스턴스 생성 (미등록 국가는 기본 파서)"""
+    parser_class = PARSERS.get(country.lower(), DefaultTextParser)
+    return parser_class(client)
+
+
 __all__ = [
     'TextBasedParser',
     'VisionBasedParser',
@@ -38,4 +59,6 @@ __all__ = [
     'TurkeyParser',
     'PakistanParser',
     'ParserFactory',
+    'PARSERS',
+    'get_parser',
 ]
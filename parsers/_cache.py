@@ -0,0 +1,90 @@
+"""
+Parse Result Cache
+PDF SHA-256 기반 파싱 결과 디스크 캐시
+"""
+
+import functools
+import hashlib
+import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 캐시 저장 경로: ~/.cache/lee_project/parsed/<key>.json
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "lee_project", "parsed")
+
+
+def file_sha256(path: str) -> str:
+    """파일 SHA-256 계산 (64KB 청크 스트리밍 - 대용량 PDF도 메모리 부담 없음)"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def get(key: str):
+    """캐시 조회 - 없거나 손상되면 None"""
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    try:
+        return orjson.loads(data) if orjson else json.loads(data)
+    except ValueError:
+        return None
+
+
+def put(key: str, items) -> None:
+    """캐시 저장 - 실패해도 파싱 결과에는 영향 없음"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        if orjson:
+            payload = orjson.dumps(items)
+        else:
+            payload = json.dumps(items, ensure_ascii=False).encode("utf-8")
+        with open(os.path.join(CACHE_DIR, f"{key}.json"), 'wb') as f:
+            f.write(payload)
+    except OSError:
+        pass
+
+
+def _prompt_sha(parser) -> str:
+    """파서의 추출 프롬프트 해시 (프롬프트 변경 시 캐시 자동 무효화)"""
+    try:
+        prompt = parser.create_extraction_prompt()
+        return hashlib.sha256(prompt.encode()).hexdigest()[:16]
+    except Exception:
+        return "noprompt"
+
+
+def cached_process(process_method):
+    """
+    parser.process(pdf_path) 결과를 디스크에 캐시하는 데코레이터
+    - 키: PDF 내용 SHA-256 + 파서 클래스명 + 프롬프트 SHA
+    - 동일 PDF 재처리 시 LLM 호출 없이 캐시 반환
+    - 프롬프트를 수정하면 키가 바뀌어 이전 결과를 자동으로 비켜감
+    """
+    @functools.wraps(process_method)
+    def wrapper(self, pdf_path, *args, **kwargs):
+        try:
+            key = f"{file_sha256(pdf_path)}_{type(self).__name__}_{_prompt_sha(self)}"
+        except OSError:
+            return process_method(self, pdf_path, *args, **kwargs)
+
+        cached = get(key)
+        if cached is not None:
+            print(f"  ⚡ Cache hit for {os.path.basename(pdf_path)}: {len(cached)} items")
+            return cached
+
+        items = process_method(self, pdf_path, *args, **kwargs)
+        if items:
+            put(key, items)
+        return items
+
+    return wrapper
@@ -0,0 +1,22 @@
+"""
+Item Combination Helper
+HS Code × 템플릿 Cartesian 조합 생성 공용 헬퍼
+"""
+
+from itertools import product
+from typing import Dict, Iterable, List
+
+
+def cartesian_items(hs_codes: Iterable[str], templates: Iterable[Dict]) -> List[Dict]:
+    """
+    HS Code × 템플릿 전체 조합 생성
+    - 각 행은 {**template, 'hs_code': hs} 1회의 C 레벨 dict 복사로 생성
+    - hs_codes의 순서를 그대로 따름 (정렬이 필요하면 호출측에서 sorted() 전달)
+    """
+    templates = list(templates)
+    if not templates:
+        return []
+    return [
+        {**template, 'hs_code': hs_code}
+        for hs_code, template in product(hs_codes, templates)
+    ]
@@ -5,13 +5,34 @@ OCR(텍스트) 및 Vision API 기반 파싱의 기본 클래스
 
 import re
 import json
-import base64
+import binascii
+import hashlib
 import io
+import os
+import pickle
 import fitz  # PyMuPDF
 from typing import Dict, List, Tuple, Optional
 from openai import OpenAI
 from PIL import Image, ImageEnhance, ImageFilter
 
+from ._cache import cached_process
+
+# orjson이 있으면 LLM 응답 JSON 파싱에 사용 (json.loads 대비 2-10배), 없으면 표준 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(s):
+    """orjson 우선 JSON 디코드 (실패 시 양쪽 모두 ValueError 계열을 던짐)"""
+    return orjson.loads(s) if orjson else json.loads(s)
+
+
+# 케이스 넘버 정규화용 패턴 (호출마다 re 캐시 조회 방지)
+_CASE_SPLIT_RE = re.compile(r'[,;]')
+_VALID_CASE_RE = re.compile(r'[AC]-\d{3}-\d{3}', re.IGNORECASE)
+
 
 def normalize_case_number(case_number: Optional[str]) -> Optional[str]:
     """
@@ -34,7 +55,7 @@ def normalize_case_number(case_number: Optional[str]) -> Optional[str]:
 
     # 여러 케이스 넘버가 쉼표나 세미콜론으로 구분되어 있으면 첫 번째만 추출
     if ',' in case_str or ';' in case_str:
-        case_str = re.split(r'[,;]', case_str)[0].strip()
+        case_str = _CASE_SPLIT_RE.split(case_str)[0].strip()
 
     # 공백 제거
     case_str = case_str.replace(' ', '')
@@ -42,14 +63,90 @@ def normalize_case_number(case_number: Optional[str]) -> Optional[str]:
     # 유효한 케이스 넘버 형식 검증
     # 미국: A-XXX-XXX (Antidumping) 또는 C-XXX-XXX (Countervailing) 형식만 허용
     # Court Number (22-XXXXX), 기타 형식은 제외
-    if not re.match(r'^[AC]-\d{3}-\d{3}$', case_str, re.IGNORECASE):
+    if not _VALID_CASE_RE.fullmatch(case_str):
         return None
 
     return case_str
 
 # Vision API 설정
 BATCH_PAGE_LIMIT = 10  # 한 번에 처리할 최대 페이지 수
-HIGH_QUALITY_DPI = 200  # 이미지 해상도
+HIGH_QUALITY_DPI = 200
+
+# \t \n \r 를 제외한 제어 문자를 삭제하는 변환 테이블
+_CTRL_TBL = dict.fromkeys(i for i in range(32) if i not in (9, 10, 13))
+
+# JSON 정리용 패턴 (응답마다 재컴파일하지 않도록 모듈 로드 시 1회 컴파일)
+_FENCE_RE = re.compile(r'```(?:json)?\s*\n(.*?)\n```', re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+
+# 래스터화 결과 디스크 캐시: ~/.cache/lee_project/pages/<key>.pkl
+# (하이브리드 파서의 텍스트 실패 → Vision 재시도, 동일 PDF 재실행 시 재래스터화 방지)
+_PAGE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "lee_project", "pages")  # 이미지 해상도
+
+
+def pdf_to_b64_pages(
+    pdf_path: str,
+    dpi: int = 150,
+    max_pages: int = None,
+    enhance_fn=None
+) -> List[Tuple[int, str]]:
+    """
+    PDF를 페이지별 Base64 이미지로 변환 (텍스트/Vision 파서 공용 헬퍼)
+    래스터화 최적화가 모든 Vision 경로에 동일하게 적용되도록 한 곳에 모음
+    결과는 (경로, mtime, dpi, max_pages, 보정 여부) 키로 디스크에 캐시
+    """
+    try:
+        mtime = os.path.getmtime(pdf_path)
+        raw_key = f"{pdf_path}:{mtime}:{dpi}:{max_pages}:{1 if enhance_fn else 0}"
+        cache_key = hashlib.sha1(raw_key.encode()).hexdigest()
+        cache_path = os.path.join(_PAGE_CACHE_DIR, f"{cache_key}.pkl")
+    except OSError:
+        cache_path = None
+
+    if cache_path is not None:
+        try:
+            with open(cache_path, 'rb') as f:
+                page_images = pickle.load(f)
+            print(f"  ⚡ Page image cache hit ({len(page_images)} pages)")
+            return page_images
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass  # 캐시 미스 또는 손상 → 재래스터화
+
+    try:
+        doc = fitz.open(pdf_path)
+        page_images: List[Tuple[int, str]] = []
+
+        for page_index, page in enumerate(doc):
+            page_num = page_index + 1
+            if max_pages is not None and page_num > max_pages:
+                break
+
+            pix = page.get_pixmap(dpi=dpi)
+            img_bytes = pix.tobytes("png")
+
+            if enhance_fn is not None:
+                img_bytes = enhance_fn(img_bytes)
+
+            # b64encode보다 빠른 내부 커널 직접 호출 (base64는 ASCII 보장)
+            b64 = binascii.b2a_base64(img_bytes, newline=False).decode("ascii")
+            page_images.append((page_num, b64))
+
+        doc.close()
+
+        # 빈 결과는 캐시하지 않음 (일시 오류 가능성)
+        if cache_path is not None and page_images:
+            try:
+                os.makedirs(_PAGE_CACHE_DIR, exist_ok=True)
+                with open(cache_path, 'wb') as f:
+                    pickle.dump(page_images, f)
+            except OSError:
+                pass  # 캐시 실패는 치명적이지 않음
+
+        return page_images
+
+    except Exception as e:
+        print(f"  ✗ Error extracting images from PDF: {e}")
+        return []
 
 
 class TextBasedParser:
@@ -72,6 +169,8 @@ class TextBasedParser:
         """
         for attempt in range(max_retries):
             try:
+                # 고정 지시문은 system 메시지에 (배치마다 동일 → OpenAI 프롬프트 캐시 적중)
+                # user 메시지에는 문서 텍스트만 전달
                 response = self.client.chat.completions.create(
                     model=self.model_name,
                     messages=[
@@ -81,12 +180,13 @@ class TextBasedParser:
                                 "You are a precise data extraction assistant. "
                                 "Always output complete, valid JSON only. "
                                 "Extract ALL information accurately. "
-                                "IMPORTANT: Always close all JSON strings and objects properly."
+                                "IMPORTANT: Always close all JSON strings and objects properly.\n\n"
+                                f"{prompt}"
                             )
                         },
                         {
                             "role": "user",
-                            "content": f"{prompt}\n\n[DOCUMENT TEXT]\n{text}"
+                            "content": f"[DOCUMENT TEXT]\n{text}"
                         }
                     ],
                     max_completion_tokens=16000,
@@ -109,19 +209,12 @@ class TextBasedParser:
         if not response:
             return []
 
-        # 제어 문자 제거
-        response = ''.join(
-            char for char in response
-            if ord(char) >= 32 or char in '\n\t\r'
-        )
+        # 제어 문자 제거 (translate는 C 레벨 단일 패스 - 문자별 제너레이터 대비 수십 배 빠름)
+        response = response.translate(_CTRL_TBL)
 
         # ```json 블럭 처리
         if '```' in response:
-            json_match = re.search(
-                r'```(?:json)?\s*\n(.*?)\n```',
-                response,
-                re.DOTALL
-            )
+            json_match = _FENCE_RE.search(response)
             if json_match:
                 response = json_match.group(1)
 
@@ -133,7 +226,7 @@ class TextBasedParser:
                 response = response[first_brace:]
 
         # 콤마 정리
-        response = re.sub(r',(\s*[}\]])', r'\1', response)
+        response = _TRAILING_COMMA_RE.sub(r'\1', response)
 
         # JSON 복구 시도 (잘린 JSON 처리)
         def try_repair_json(text: str) -> str:
@@ -161,9 +254,9 @@ class TextBasedParser:
                     potential += '}' * open_braces
                 
                 try:
-                    json.loads(potential)
+                    _json_loads(potential)
                     return potential
-                except:
+                except ValueError:
                     pass
             
             # 2. 열린 문자열 닫기
@@ -199,7 +292,7 @@ class TextBasedParser:
             return repaired
 
         try:
-            data = json.loads(response)
+            data = _json_loads(response)
             items = data.get('items', [])
 
             # 케이스 넘버 정규화
@@ -209,14 +302,15 @@ class TextBasedParser:
 
             print(f"    ✓ Parsed {len(items)} items successfully")
             return items
-        except json.JSONDecodeError as e:
+        # orjson.JSONDecodeError와 json.JSONDecodeError 모두 ValueError 하위
+        except ValueError as e:
             print(f"  ⚠ JSON decode error: {e}")
             print(f"  🔧 Attempting JSON repair...")
             
             # JSON 복구 시도
             repaired = try_repair_json(response)
             try:
-                data = json.loads(repaired)
+                data = _json_loads(repaired)
                 items = data.get('items', [])
                 
                 # 케이스 넘버 정규화
@@ -226,7 +320,7 @@ class TextBasedParser:
                 
                 print(f"    ✓ JSON repaired! Parsed {len(items)} items successfully")
                 return items
-            except json.JSONDecodeError as e2:
+            except ValueError as e2:
                 print(f"  ✗ JSON repair failed: {e2}")
                 # 디버깅용: 마지막 500자 출력
                 print(f"  📋 Last 500 chars of response: ...{response[-500:]}")
@@ -278,38 +372,19 @@ class VisionBasedParser:
         enhance: bool = True
     ) -> List[Tuple[int, str]]:
         """PDF를 페이지별 이미지(Base64)로 변환"""
-        try:
-            doc = fitz.open(pdf_path)
-            page_images: List[Tuple[int, str]] = []
-
-            for page_index, page in enumerate(doc):
-                page_num = page_index + 1
-                if max_pages is not None and page_num > max_pages:
-                    break
-
-                # 이미지로 변환
-                pix = page.get_pixmap(dpi=dpi)
-                img_bytes = pix.tobytes("png")
-
-                # 이미지 품질 향상
-                if enhance:
-                    img_bytes = self.enhance_image(img_bytes)
-
-                b64 = base64.b64encode(img_bytes).decode("utf-8")
-                page_images.append((page_num, b64))
-
-            doc.close()
+        page_images = pdf_to_b64_pages(
+            pdf_path,
+            dpi=dpi,
+            max_pages=max_pages,
+            enhance_fn=self.enhance_image if enhance else None
+        )
 
-            if not page_images:
-                print("  ✗ No pages extracted from PDF")
-            else:
-                print(f"  ✓ Extracted {len(page_images)} pages as images (DPI: {dpi})")
+        if not page_images:
+            print("  ✗ No pages extracted from PDF")
+        else:
+            print(f"  ✓ Extracted {len(page_images)} pages as images (DPI: {dpi})")
 
-            return page_images
-
-        except Exception as e:
-            print(f"  ✗ Error extracting images from PDF: {e}")
-            return []
+        return page_images
 
     def call_vision_api(
         self,
@@ -375,19 +450,12 @@ class VisionBasedParser:
         if not response:
             return []
 
-        # 제어 문자 제거
-        response = ''.join(
-            char for char in response
-            if ord(char) >= 32 or char in '\n\t\r'
-        )
+        # 제어 문자 제거 (translate는 C 레벨 단일 패스 - 문자별 제너레이터 대비 수십 배 빠름)
+        response = response.translate(_CTRL_TBL)
 
         # ```json 블럭 처리
         if '```' in response:
-            json_match = re.search(
-                r'```(?:json)?\s*\n(.*?)\n```',
-                response,
-                re.DOTALL
-            )
+            json_match = _FENCE_RE.search(response)
             if json_match:
                 response = json_match.group(1)
 
@@ -399,7 +467,7 @@ class VisionBasedParser:
                 response = response[first_brace:]
 
         # 콤마 정리
-        response = re.sub(r',(\s*[}\]])', r'\1', response)
+        response = _TRAILING_COMMA_RE.sub(r'\1', response)
 
         # 중괄호 짝 맞추기
         if not response.rstrip().endswith('}'):
@@ -414,7 +482,7 @@ class VisionBasedParser:
                 response += '}' * (open_braces - close_braces)
 
         try:
-            data = json.loads(response)
+            data = _json_loads(response)
             items = data.get('items', [])
 
             # 케이스 넘버 정규화
@@ -424,10 +492,12 @@ class VisionBasedParser:
 
             print(f"    ✓ Parsed {len(items)} items successfully")
             return items
-        except json.JSONDecodeError as e:
+        # orjson.JSONDecodeError와 json.JSONDecodeError 모두 ValueError 하위
+        except ValueError as e:
             print(f"  ⚠ JSON decode error: {e}")
             return []
 
+    @cached_process
     def process(self, pdf_path: str) -> List[Dict]:
         """PDF 처리 (Vision API)"""
         page_imgs = self.get_pdf_page_images(pdf_path)
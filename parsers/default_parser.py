@@ -3,18 +3,76 @@ Default Text Parser for all countries
 모든 국가에 대한 기본 텍스트 파서
 """
 
-import base64
+import functools
+import os
+import re
 import fitz  # PyMuPDF
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List
 
-from .base_parser import TextBasedParser
+from ._cache import cached_process
+from .base_parser import TextBasedParser, pdf_to_b64_pages
+
+# 페이지 경계 마커 (extract_text_from_pdf가 삽입)
+_PAGE_BOUNDARY = re.compile(r'\n--- PAGE ')
+
+
+def iter_pages(text: str, start: int = 0) -> Iterator[str]:
+    """
+    페이지 경계 기준으로 텍스트를 스트리밍 분할
+    str.split처럼 전체 리스트를 만들지 않고 한 조각씩만 유지 (피크 메모리 절감)
+    start 오프셋부터 스캔하므로 호출측에서 앞부분을 잘라 복사할 필요가 없음
+    """
+    prev = start
+    for match in _PAGE_BOUNDARY.finditer(text, start):
+        yield text[prev:match.start()]
+        prev = match.end()
+    yield text[prev:]
+
+
+def iter_pdf_pages_text(pdf_path: str, max_pages: int = None) -> Iterator[str]:
+    """
+    페이지 텍스트를 한 장씩 스트리밍 추출
+    전체 문서를 메모리에 올리지 않으므로 호출측에서 조기 종료 가능
+    """
+    try:
+        doc = fitz.open(pdf_path)
+    except Exception as e:
+        print(f"  ✗ Error extracting text: {e}")
+        return
+
+    try:
+        for page_num, page in enumerate(doc):
+            if max_pages and page_num >= max_pages:
+                break
+
+            # 레이아웃 정렬 생략 + 공백 보존 (기본 추출기 대비 후처리 비용 절감)
+            text = page.get_text(
+                "text",
+                flags=fitz.TEXT_PRESERVE_WHITESPACE,
+                sort=False
+            )
+            if text.strip():
+                yield f"\n--- PAGE {page_num + 1} ---\n{text}"
+    finally:
+        doc.close()
 
 
 def extract_text_from_pdf(pdf_path: str, max_pages: int = None) -> str:
     """
     PyMuPDF로 PDF에서 텍스트 직접 추출 (무료, 빠름)
     이미지 기반 PDF는 Vision API 폴백
+    결과는 (경로, mtime)로 캐시 - 같은 실행 중 파일이 바뀌면 자동 무효화
     """
+    try:
+        mtime = os.path.getmtime(pdf_path)
+    except OSError:
+        mtime = None
+    return _extract_text_cached(pdf_path, max_pages, mtime)
+
+
+@functools.lru_cache(maxsize=8)
+def _extract_text_cached(pdf_path: str, max_pages: int, _mtime) -> str:
     try:
         doc = fitz.open(pdf_path)
         texts = []
@@ -28,7 +86,12 @@ def extract_text_from_pdf(pdf_path: str, max_pages: int = None) -> str:
             if max_pages and page_num >= max_pages:
                 break
 
-            text = page.get_text()
+            # 레이아웃 정렬 생략 + 공백 보존 (기본 추출기 대비 후처리 비용 절감)
+            text = page.get_text(
+                "text",
+                flags=fitz.TEXT_PRESERVE_WHITESPACE,
+                sort=False
+            )
             if text.strip():
                 texts.append(f"\n--- PAGE {page_num + 1} ---\n{text}")
 
@@ -62,16 +125,9 @@ class DefaultTextParser(TextBasedParser):
 
 **CRITICAL INSTRUCTIONS:**
 
-1. **HS Code Separation - MANDATORY:**
-   - If multiple HS codes are listed, create SEPARATE items for EACH HS code
-   - DO NOT combine multiple HS codes into one item
-
-2. **Country Separation - MANDATORY:**
-   - If multiple countries are listed, create SEPARATE items for EACH country
-   - DO NOT combine multiple countries into one item
-
-3. **Company Handling:**
-   - If multiple companies are listed, create separate items for each company
+1. ONE hs_code per item - if multiple HS codes are listed, create SEPARATE items for EACH
+2. ONE country per item - if multiple countries are listed, create SEPARATE items for EACH
+3. ONE company per item - create ALL combinations: each HS code × each country × each company
 
 OUTPUT JSON FORMAT:
 
@@ -95,11 +151,7 @@ OUTPUT JSON FORMAT:
   ]
 }
 
-**REMEMBER:**
-- ONE hs_code per item
-- ONE country per item
-- Create ALL combinations: each HS code × each country × each company
-- Output ONLY JSON, no explanatory text.
+Output ONLY JSON, no explanatory text.
 """
 
     def process_image_pdf_with_vision(self, pdf_path: str) -> List[Dict]:
@@ -109,63 +161,53 @@ OUTPUT JSON FORMAT:
         """
         print(f"  🖼️  Processing image-based PDF with Vision API...")
 
-        try:
-            doc = fitz.open(pdf_path)
-            all_items = []
-
-            # 페이지를 배치로 처리 (비용 절감)
-            batch_size = 10
-            total_pages = len(doc)
-
-            for start in range(0, total_pages, batch_size):
-                end = min(start + batch_size, total_pages)
-                print(f"  ▶ Vision batch pages {start+1}–{end}")
-
-                # 이미지로 변환
-                images_b64 = []
-                for page_num in range(start, end):
-                    page = doc[page_num]
-                    pix = page.get_pixmap(dpi=150)  # 저해상도로 비용 절감
-                    img_bytes = pix.tobytes("png")
-                    b64 = base64.b64encode(img_bytes).decode("utf-8")
-                    images_b64.append(b64)
-
-                # Vision API 호출
-                content = [{"type": "text", "text": self.create_extraction_prompt()}]
-                for b64 in images_b64:
-                    content.append({
-                        "type": "image_url",
-                        "image_url": {"url": f"data:image/png;base64,{b64}"}
-                    })
-
-                try:
-                    response = self.client.chat.completions.create(
-                        model=self.vision_model,
-                        messages=[
-                            {"role": "system", "content": "You are a precise data extraction assistant. Always output complete, valid JSON only."},
-                            {"role": "user", "content": content}
-                        ],
-                        max_tokens=16000,
-                        temperature=0.1
-                    )
-
-                    response_text = response.choices[0].message.content.strip()
-                    items = self.parse_response(response_text)
-                    all_items.extend(items)
-                    print(f"  ✓ Batch {start+1}–{end}: {len(items)} items")
-
-                except Exception as e:
-                    print(f"  ✗ Vision API error for batch {start+1}–{end}: {e}")
-                    continue
+        # 공용 헬퍼로 래스터화 (저해상도로 비용 절감)
+        page_images = pdf_to_b64_pages(pdf_path, dpi=150)
+        if not page_images:
+            return []
 
-            doc.close()
-            print(f"  ➜ Total items from Vision API: {len(all_items)}")
-            return all_items
+        all_items = []
 
-        except Exception as e:
-            print(f"  ✗ Image processing error: {e}")
-            return []
+        # 페이지를 배치로 처리 (비용 절감)
+        batch_size = 10
+        total_pages = len(page_images)
+
+        for start in range(0, total_pages, batch_size):
+            end = min(start + batch_size, total_pages)
+            print(f"  ▶ Vision batch pages {start+1}–{end}")
+
+            # Vision API 호출
+            content = [{"type": "text", "text": self.create_extraction_prompt()}]
+            for _, b64 in page_images[start:end]:
+                content.append({
+                    "type": "image_url",
+                    "image_url": {"url": f"data:image/png;base64,{b64}"}
+                })
+
+            try:
+                response = self.client.chat.completions.create(
+                    model=self.vision_model,
+                    messages=[
+                        {"role": "system", "content": "You are a precise data extraction assistant. Always output complete, valid JSON only."},
+                        {"role": "user", "content": content}
+                    ],
+                    max_tokens=16000,
+                    temperature=0.1
+                )
+
+                response_text = response.choices[0].message.content.strip()
+                items = self.parse_response(response_text)
+                all_items.extend(items)
+                print(f"  ✓ Batch {start+1}–{end}: {len(items)} items")
+
+            except Exception as e:
+                print(f"  ✗ Vision API error for batch {start+1}–{end}: {e}")
+                continue
 
+        print(f"  ➜ Total items from Vision API: {len(all_items)}")
+        return all_items
+
+    @cached_process
     def process(self, pdf_path: str) -> List[Dict]:
         """PDF에서 텍스트 추출 후 LLM으로 파싱"""
         # 1. 텍스트 추출 시도 (무료)
@@ -186,36 +228,44 @@ OUTPUT JSON FORMAT:
         if len(text) > max_chars:
             print(f"  📊 Text too long ({len(text):,} chars), splitting into batches...")
 
-            # 페이지 단위로 분할
-            pages = text.split("\n--- PAGE ")
-            batch_text = ""
-            batch_num = 1
+            # 페이지 단위로 분할 (스트리밍 - 전체 페이지 리스트 비생성)
+            # 문자열 += 대신 리스트 누적 + join (O(n²) → O(n))
+            pages = iter_pages(text)
+            batch_parts: List[str] = []
+            batch_len = 0
+            batches: List[str] = []
 
             for page in pages:
                 if not page.strip():
                     continue
 
-                page_text = "--- PAGE " + page if batch_text else page
-
-                if len(batch_text) + len(page_text) > max_chars:
-                    # 현재 배치 처리
-                    print(f"  ▶ Processing batch {batch_num} ({len(batch_text):,} chars)...")
-                    prompt = self.create_extraction_prompt()
-                    response = self.parse_text_with_llm(batch_text, prompt)
-                    items = self.parse_response(response)
-                    all_items.extend(items)
-                    print(f"  ✓ Batch {batch_num}: {len(items)} items")
+                page_text = "--- PAGE " + page if batch_parts else page
 
-                    batch_text = page_text
-                    batch_num += 1
+                if batch_len + len(page_text) > max_chars:
+                    batches.append("\n".join(batch_parts))
+                    batch_parts = [page_text]
+                    batch_len = len(page_text)
                 else:
-                    batch_text += "\n" + page_text
+                    batch_parts.append(page_text)
+                    batch_len += len(page_text) + 1
+
+            # 마지막 배치
+            last_batch = "\n".join(batch_parts)
+            if last_batch.strip():
+                batches.append(last_batch)
+
+            prompt = self.create_extraction_prompt()
+            print(f"  ▶ Processing {len(batches)} batches in parallel...")
+
+            # 배치별 LLM 호출은 서로 독립 → 스레드 병렬화 (네트워크 대기 중 GIL 해제)
+            with ThreadPoolExecutor(max_workers=min(8, len(batches))) as executor:
+                responses = list(executor.map(
+                    lambda batch: self.parse_text_with_llm(batch, prompt),
+                    batches
+                ))
 
-            # 마지막 배치 처리
-            if batch_text.strip():
-                print(f"  ▶ Processing batch {batch_num} ({len(batch_text):,} chars)...")
-                prompt = self.create_extraction_prompt()
-                response = self.parse_text_with_llm(batch_text, prompt)
+            # 응답 파싱은 순차 처리 (결과 순서 유지)
+            for batch_num, response in enumerate(responses, start=1):
                 items = self.parse_response(response)
                 all_items.extend(items)
                 print(f"  ✓ Batch {batch_num}: {len(items)} items")
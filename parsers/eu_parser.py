@@ -3,354 +3,126 @@ EU Tariff Parser
 유럽연합 관세 정보 파서 - OCR 및 Vision API 버전
 """
 
+import functools
+import logging
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Optional
-from .default_parser import DefaultTextParser
+from .default_parser import DefaultTextParser, iter_pages
 from .base_parser import VisionBasedParser
 
+logger = logging.getLogger(__name__)
 
-# ============================================================================
-# OCR (텍스트 추출) 버전
-# ============================================================================
-
-class EUTextParser(DefaultTextParser):
-    """유럽연합 특화 파서 - OCR 버전 (ANTI-DUMPING MEASURES 섹션만 사용, MIP 처리)"""
-
-    def extract_measures_section(self, text: str) -> str:
-        """7. ANTI-DUMPING MEASURES 섹션만 추출"""
-        patterns = [
-            r'7\.?\s*ANTI-DUMPING\s+MEASURES',
-            r'DEFINITIVE\s+ANTI-DUMPING\s+MEASURES',
-            r'Article\s+1\s*\n',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                measures_text = text[match.start():]
-                # 30000자 제한
-                if len(measures_text) > 30000:
-                    measures_text = measures_text[:30000]
-                print(f"    📝 Extracted MEASURES section ({len(measures_text):,} chars)")
-                return measures_text
-        
-        print(f"    ⚠ ANTI-DUMPING MEASURES section not found, using last 30000 chars")
-        return text[-30000:]
-
-    def extract_mip_info(self, text: str) -> Optional[str]:
-        """Minimum Import Price 정보 추출"""
-        mip_patterns = [
-            r'MIPs?\s+(?:currently\s+)?(?:in\s+force\s+)?(?:range\s+)?(?:between\s+)?[\d,\s]+EUR[^.]*',
-            r'minimum\s+import\s+price[s]?\s*(?:of)?\s*[\d,\s]+EUR[^.]*',
-            r'MIP\s*\([^)]*EUR[^)]*\)',
-        ]
-        
-        for pattern in mip_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                mip_text = match.group().strip()
-                # 너무 길면 자르기
-                if len(mip_text) > 150:
-                    mip_text = mip_text[:150] + "..."
-                return mip_text
-        return None
-
-    def normalize_hs_code(self, hs_code: str) -> str:
-        """HS 코드를 XXXX.XX.XX 형식으로 정규화 (ex 제거, 공백 제거)"""
-        if not hs_code:
-            return None
-        
-        # 문자열로 변환
-        hs_str = str(hs_code)
-        
-        # ex 접두어 제거
-        hs_str = re.sub(r'^ex\s*', '', hs_str, flags=re.IGNORECASE)
-        
-        # 숫자만 추출 (공백, 점 등 제거)
-        digits = re.sub(r'[^\d]', '', hs_str)
-        
-        # 8자리가 아니면 None 반환 (10자리 무시)
-        if len(digits) != 8:
-            return None
-        
-        # XXXX.XX.XX 형식으로 포맷
-        formatted = f"{digits[:4]}.{digits[4:6]}.{digits[6:8]}"
-        return formatted
-
-    def post_process_items(self, items: List[Dict], mip_info: str = None) -> List[Dict]:
-        """추출된 아이템들에 대한 HS 코드 후처리 및 MIP 정보 추가"""
-        processed_items = []
-        
-        for item in items:
-            # HS 코드 정규화
-            hs_code = item.get('hs_code')
-            if hs_code:
-                normalized_hs = self.normalize_hs_code(hs_code)
-                if normalized_hs:
-                    item['hs_code'] = normalized_hs
-                else:
-                    # 8자리가 아니면 아이템 제외
-                    print(f"    ⚠ Skipping invalid HS code: {hs_code}")
-                    continue
-            
-            # MIP 정보 추가 (note가 비어있는 경우에만)
-            if mip_info and not item.get('note'):
-                item['note'] = f"MIP: {mip_info}"
-            
-            processed_items.append(item)
-        
-        return processed_items
-
-    def process(self, pdf_path: str) -> List[Dict]:
-        """PDF 처리: ANTI-DUMPING MEASURES 섹션만 추출 후 파싱"""
-        from .default_parser import extract_text_from_pdf
-        
-        # 1. 텍스트 추출
-        text = extract_text_from_pdf(pdf_path)
-        
-        if not text or len(text) < 100:
-            print(f"  💡 Text extraction failed, switching to Vision API")
-            return self.process_image_pdf_with_vision(pdf_path)
-        
-        # 2. MIP 정보 추출 (전체 텍스트에서)
-        mip_info = self.extract_mip_info(text)
-        if mip_info:
-            print(f"    📝 Found MIP: {mip_info[:80]}...")
-        
-        # 3. MEASURES 섹션만 추출
-        measures_text = self.extract_measures_section(text)
-        
-        # 4. 텍스트가 너무 길면 배치로 나누기
-        max_chars = 100000
-        all_items = []
-
-        if len(measures_text) > max_chars:
-            print(f"  📊 Text too long ({len(measures_text):,} chars), splitting into batches...")
-            pages = measures_text.split("\n--- PAGE ")
-            batch_text = ""
-            batch_num = 1
-
-            for page in pages:
-                if not page.strip():
-                    continue
-                page_text = "--- PAGE " + page if batch_text else page
-                if len(batch_text) + len(page_text) > max_chars:
-                    print(f"  ▶ Processing batch {batch_num} ({len(batch_text):,} chars)...")
-                    prompt = self.create_extraction_prompt()
-                    response = self.parse_text_with_llm(batch_text, prompt)
-                    items = self.parse_response(response)
-                    all_items.extend(items)
-                    print(f"  ✓ Batch {batch_num}: {len(items)} items")
-                    batch_text = page_text
-                    batch_num += 1
-                else:
-                    batch_text += "\n" + page_text
-
-            if batch_text.strip():
-                print(f"  ▶ Processing batch {batch_num} ({len(batch_text):,} chars)...")
-                prompt = self.create_extraction_prompt()
-                response = self.parse_text_with_llm(batch_text, prompt)
-                items = self.parse_response(response)
-                all_items.extend(items)
-                print(f"  ✓ Batch {batch_num}: {len(items)} items")
-        else:
-            print(f"  ▶ Processing MEASURES section ({len(measures_text):,} chars)...")
-            prompt = self.create_extraction_prompt()
-            response = self.parse_text_with_llm(measures_text, prompt)
-            all_items = self.parse_response(response)
-
-        print(f"  ➜ Total items from all batches: {len(all_items)}")
-        
-        # 5. 후처리 (HS 코드 정규화, MIP 추가)
-        processed_items = self.post_process_items(all_items, mip_info)
-        
-        print(f"  📝 After post-processing: {len(processed_items)} items")
-        return processed_items
+try:
+    import hyperscan  # 선택 의존성 - 설치돼 있으면 멀티패턴 스캔 가속
+except ImportError:
+    hyperscan = None
 
 
 # ============================================================================
-# Vision API 버전
+# 모듈 로드 시 1회 컴파일 (아이템별 호출 경로에서 re 캐시 조회/패턴 파싱 제거)
 # ============================================================================
 
-class EUVisionParser(VisionBasedParser):
-    """유럽연합 특화 파서 - Vision API 버전"""
+# 패턴별 개별 스캔 대신 단일 교대(alternation)로 텍스트를 한 번만 훑는다.
+# 그룹 이름 순서(p0 > p1 > p2)가 기존 패턴 리스트의 우선순위를 대신한다.
+_MEASURES_RE = re.compile(
+    r'(?P<p0>7\.?\s*ANTI-DUMPING\s+MEASURES)'
+    r'|(?P<p1>DEFINITIVE\s+ANTI-DUMPING\s+MEASURES)'
+    r'|(?P<p2>Article\s+1\s*\n)',
+    re.IGNORECASE
+)
+_MEASURES_PRIORITY = ('p0', 'p1', 'p2')
+
+# hyperscan용 동일 패턴 (바이트 기반, id 순서 = 우선순위)
+_MEASURES_HS_PATTERNS = [
+    (0, rb'7\.?\s*ANTI-DUMPING\s+MEASURES'),
+    (1, rb'DEFINITIVE\s+ANTI-DUMPING\s+MEASURES'),
+    (2, rb'Article\s+1\s*\n'),
+]
+_measures_hs_db = None
+
+
+def _get_measures_hs_db():
+    """hyperscan DB 지연 컴파일 (미설치 시 None → stdlib re 폴백)"""
+    global _measures_hs_db
+    if hyperscan is None:
+        return None
+    if _measures_hs_db is None:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[pat for _, pat in _MEASURES_HS_PATTERNS],
+            ids=[pat_id for pat_id, _ in _MEASURES_HS_PATTERNS],
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST]
+                  * len(_MEASURES_HS_PATTERNS),
+        )
+        _measures_hs_db = db
+    return _measures_hs_db
+
+# 소유 수량자(++/*+)로 OCR 오염 텍스트에서의 역추적 폭주 방지 (Python 3.11+ re 지원)
+# m2의 [^)]*는 뒤따르는 EUR와 문자 집합이 겹쳐 역추적이 필요하므로 그대로 둔다.
+_MIP_RE = re.compile(
+    r'(?P<m0>MIPs?\s++(?:currently\s++)?(?:in\s++force\s++)?(?:range\s++)?(?:between\s++)?[\d,\s]++EUR[^.]*+)'
+    r'|(?P<m1>minimum\s++import\s++price[s]?\s*+(?:of)?\s*+[\d,\s]++EUR[^.]*+)'
+    r'|(?P<m2>MIP\s*+\([^)]*EUR[^)]*\))',
+    re.IGNORECASE
+)
+_MIP_PRIORITY = ('m0', 'm1', 'm2')
+
+# 월 이름은 앞 3글자로 유일하게 구분됨 - 전체/축약형 이중 엔트리 대신 12개 프리픽스 키
+_MONTH_PREFIX = {
+    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
+    'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
+    'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
+}
 
-    def __init__(self, client):
-        super().__init__(client)
-        self.model_name = "gpt-4.1"  # Vision 모델
+# 한 번의 매치로 8자리 추출+검증 ('ex' 등 비숫자는 \D*가 건너뜀, 9자리 이상은 $ 앵커로 거부)
+_HS8_RE = re.compile(r'^\D*(\d{2})\D*(\d{2})\D*(\d{2})\D*(\d{2})\D*$')
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+# 1면 제목의 규정 번호 (배치마다 LLM이 재추출하지 않도록 문서 단위로 1회 추출)
+_EU_REGULATION_RE = re.compile(r'REGULATION\s+\(EU\)\s+(\d{4}/\d+)', re.IGNORECASE)
+_DATE_DMY_RE = re.compile(r'(\d{1,2})\s+([a-zA-Z]+)\s+(\d{4})', re.IGNORECASE)
 
-    def normalize_hs_code(self, hs_code: str) -> str:
-        """HS 코드를 XXXX.XX.XX 형식으로 정규화 (ex 제거, 공백 제거)"""
-        if not hs_code:
-            return None
-        
-        # 문자열로 변환
-        hs_str = str(hs_code)
-        
-        # ex 접두어 제거
-        hs_str = re.sub(r'^ex\s+', '', hs_str, flags=re.IGNORECASE)
-        
-        # 숫자만 추출 (공백, 점 등 제거)
-        digits = re.sub(r'[^\d]', '', hs_str)
-        
-        # 8자리가 아니면 None 반환 (10자리 무시)
-        if len(digits) != 8:
-            return None
-        
-        # XXXX.XX.XX 형식으로 포맷
-        formatted = f"{digits[:4]}.{digits[4:6]}.{digits[6:8]}"
-        return formatted
 
-    def clean_company_name(self, company: str) -> str:
-        """회사명에서 첫 번째 콤마 앞만 추출"""
-        if not company:
-            return None
-        
-        # 첫 번째 콤마 앞만 추출
-        if ',' in company:
-            company = company.split(',')[0].strip()
-        
-        return company
+@functools.lru_cache(maxsize=512)
+def _normalize_date_cached(date_str: str) -> str:
+    """날짜 문자열 → YYYY-MM-DD (조사 기간 등 동일 문자열이 아이템마다 반복돼 캐시 효과 큼)"""
+    # 이미 YYYY-MM-DD 형식인지 확인
+    if _ISO_DATE_RE.match(date_str):
+        return date_str
 
-    def normalize_date(self, date_str: str) -> Optional[str]:
-        """날짜를 YYYY-MM-DD 형식으로 변환"""
-        if not date_str:
-            return None
-        
-        date_str = str(date_str).strip()
-        
-        # 이미 YYYY-MM-DD 형식인지 확인
-        if re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
-            return date_str
-        
-        # "day month year" 형식 파싱 (예: "1 July 2019", "30 June 2020")
-        month_map = {
-            'january': '01', 'jan': '01',
-            'february': '02', 'feb': '02',
-            'march': '03', 'mar': '03',
-            'april': '04', 'apr': '04',
-            'may': '05',
-            'june': '06', 'jun': '06',
-            'july': '07', 'jul': '07',
-            'august': '08', 'aug': '08',
-            'september': '09', 'sep': '09', 'sept': '09',
-            'october': '10', 'oct': '10',
-            'november': '11', 'nov': '11',
-            'december': '12', 'dec': '12'
-        }
-        
-        # "day month year" 패턴 찾기
-        pattern = r'(\d{1,2})\s+([a-zA-Z]+)\s+(\d{4})'
-        match = re.search(pattern, date_str, re.IGNORECASE)
-        if match:
-            day = match.group(1).zfill(2)
-            month_name = match.group(2).lower()
-            year = match.group(3)
-            
-            month = month_map.get(month_name)
-            if month:
-                return f"{year}-{month}-{day}"
-        
-        # 다른 형식 시도 (예: "2019-07-01", "01/07/2019" 등)
+    # "day month year" 패턴 찾기 (예: "1 July 2019", "30 June 2020")
+    match = _DATE_DMY_RE.search(date_str)
+    if match:
+        day = match.group(1).zfill(2)
+        year = match.group(3)
+
+        month = _MONTH_PREFIX.get(match.group(2)[:3].lower())
+        if month:
+            return f"{year}-{month}-{day}"
+
+    # 다른 형식 시도 - 구분자가 있을 때만 strptime 호출
+    # (매칭 불가 문자열에 대해 형식별 ValueError를 일으키지 않도록)
+    if '-' in date_str:
+        formats = ('%Y-%m-%d', '%d-%m-%Y')
+    elif '/' in date_str:
+        formats = ('%d/%m/%Y', '%m/%d/%Y', '%Y/%m/%d')
+    else:
+        formats = ()
+
+    for fmt in formats:
         try:
-            # 다양한 형식 시도
-            for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%d-%m-%Y', '%Y/%m/%d']:
-                try:
-                    dt = datetime.strptime(date_str, fmt)
-                    return dt.strftime('%Y-%m-%d')
-                except ValueError:
-                    continue
-        except Exception:
-            pass
-        
-        # 변환 실패 시 원본 반환 (나중에 수동 확인 가능)
-        return date_str
+            return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
 
-    def post_process_items(self, items: List[Dict]) -> List[Dict]:
-        """추출된 아이템들에 대한 후처리"""
-        processed_items = []
-        
-        # 모든 아이템에서 investigation_period 찾기 (첫 번째로 발견된 값 사용)
-        investigation_period_from = None
-        investigation_period_to = None
-        
-        for item in items:
-            if item.get('investigation_period_from'):
-                investigation_period_from = item.get('investigation_period_from')
-            if item.get('investigation_period_to'):
-                investigation_period_to = item.get('investigation_period_to')
-        
-        # investigation_period 날짜 정규화
-        if investigation_period_from:
-            investigation_period_from = self.normalize_date(investigation_period_from)
-        if investigation_period_to:
-            investigation_period_to = self.normalize_date(investigation_period_to)
-        
-        for item in items:
-            # 1. issuing_country 설정
-            if not item.get('issuing_country'):
-                item['issuing_country'] = 'European Union'
-            
-            # 2. HS 코드 정규화
-            hs_code = item.get('hs_code')
-            if hs_code:
-                # 이미 포맷된 경우 (7225.11.00)도 처리
-                hs_str = str(hs_code).replace('.', '').replace(' ', '')
-                normalized_hs = self.normalize_hs_code(hs_str)
-                if normalized_hs:
-                    item['hs_code'] = normalized_hs
-                else:
-                    # 8자리가 아니면 아이템 제외
-                    continue
-            
-            # 3. 날짜 필드 정규화
-            for date_field in ['effective_date_from', 'effective_date_to', 'investigation_period_from', 'investigation_period_to']:
-                if item.get(date_field):
-                    normalized_date = self.normalize_date(item[date_field])
-                    item[date_field] = normalized_date
-            
-            # 4. investigation_period를 모든 아이템에 적용 (공통 값)
-            if investigation_period_from:
-                item['investigation_period_from'] = investigation_period_from
-            if investigation_period_to:
-                item['investigation_period_to'] = investigation_period_to
-            
-            # 5. 세미콜론으로 구분된 회사 분리
-            company = item.get('company')
-            if company and ';' in company:
-                # 세미콜론으로 분리
-                company_parts = [part.strip() for part in company.split(';')]
-                
-                # 각 회사에 대해 새 아이템 생성
-                for part in company_parts:
-                    # 첫 번째 콤마 앞만 회사명으로 사용
-                    company_name = self.clean_company_name(part)
-                    
-                    # 새 아이템 생성 (회사명만 변경, 나머지는 복제)
-                    new_item = item.copy()
-                    new_item['company'] = company_name
-                    processed_items.append(new_item)
-            else:
-                # 세미콜론이 없으면 회사명만 정리
-                if company:
-                    item['company'] = self.clean_company_name(company)
-                processed_items.append(item)
-        
-        return processed_items
+    # 변환 실패 시 원본 반환 (나중에 수동 확인 가능)
+    return date_str
 
-    def process(self, pdf_path: str) -> List[Dict]:
-        """PDF 처리 및 후처리"""
-        # 부모 클래스의 process 호출
-        items = super().process(pdf_path)
-        
-        # 후처리 적용
-        processed_items = self.post_process_items(items)
-        
-        return processed_items
 
-    def create_extraction_prompt(self) -> str:
-        return """Extract tariff/trade remedy information from the EU anti-dumping Implementing Regulation PDF.
+# 대형 프롬프트는 모듈 상수로 1회만 생성 (배치마다 동일 객체 반환)
+_EU_VISION_EXTRACTION_PROMPT = """Extract tariff/trade remedy information from the EU anti-dumping Implementing Regulation PDF.
 
 **CORE RULES (MUST FOLLOW):**
 
@@ -616,6 +388,406 @@ class EUVisionParser(VisionBasedParser):
 """
 
 
+# ============================================================================
+# OCR (텍스트 추출) 버전
+# ============================================================================
+
+class EUTextParser(DefaultTextParser):
+    """유럽연합 특화 파서 - OCR 버전 (ANTI-DUMPING MEASURES 섹션만 사용, MIP 처리)"""
+
+    def _find_measures_hits(self, text: str) -> Dict[str, int]:
+        """패턴 그룹별 첫 등장 문자 오프셋 수집 (hyperscan 우선, 없으면 stdlib re)"""
+        db = _get_measures_hs_db()
+        if db is not None:
+            text_bytes = text.encode('utf-8')
+            byte_hits = {}
+
+            def _on_match(pat_id, start, end, flags, context=None):
+                if pat_id not in byte_hits or start < byte_hits[pat_id]:
+                    byte_hits[pat_id] = start
+
+            db.scan(text_bytes, match_event_handler=_on_match)
+
+            # 바이트 오프셋 → 문자 오프셋 (비ASCII 문서 대비)
+            return {
+                _MEASURES_PRIORITY[pat_id]: len(text_bytes[:start].decode('utf-8', 'ignore'))
+                for pat_id, start in byte_hits.items()
+            }
+
+        # stdlib 폴백: 단일 패스로 패턴별 첫 등장 위치 수집
+        first_hits = {}
+        for match in _MEASURES_RE.finditer(text):
+            group = match.lastgroup
+            if group not in first_hits:
+                first_hits[group] = match.start()
+                if len(first_hits) == len(_MEASURES_PRIORITY):
+                    break
+        return first_hits
+
+    def _find_measures_start(self, text: str) -> Optional[int]:
+        """MEASURES 섹션 시작 문자 오프셋 (우선순위 적용)"""
+        hits = self._find_measures_hits(text)
+        for group in _MEASURES_PRIORITY:
+            if group in hits:
+                return hits[group]
+        return None
+
+    def extract_measures_section(self, text: str) -> str:
+        """7. ANTI-DUMPING MEASURES 섹션만 추출"""
+        start = self._find_measures_start(text)
+        if start is not None:
+            measures_text = text[start:]
+            # 30000자 제한
+            if len(measures_text) > 30000:
+                measures_text = measures_text[:30000]
+            print(f"    📝 Extracted MEASURES section ({len(measures_text):,} chars)")
+            return measures_text
+
+        print(f"    ⚠ ANTI-DUMPING MEASURES section not found, using last 30000 chars")
+        return text[-30000:]
+
+    def extract_mip_info(self, text: str) -> Optional[str]:
+        """Minimum Import Price 정보 추출"""
+        # 리터럴 사전 검사 - 'EUR'/'MIP'이 없으면 정규식 자체를 건너뜀
+        # (substring 검색은 C의 memmem이라 정규식 스캔보다 훨씬 저렴)
+        if 'EUR' not in text and 'MIP' not in text:
+            return None
+
+        # 단일 패스로 패턴별 첫 매치 수집 (최우선 패턴이 나오면 즉시 종료)
+        first_hits = {}
+        for match in _MIP_RE.finditer(text):
+            group = match.lastgroup
+            if group not in first_hits:
+                first_hits[group] = match.group()
+                if group == _MIP_PRIORITY[0]:
+                    break
+
+        for group in _MIP_PRIORITY:
+            if group in first_hits:
+                mip_text = first_hits[group].strip()
+                # 너무 길면 자르기
+                if len(mip_text) > 150:
+                    mip_text = mip_text[:150] + "..."
+                return mip_text
+        return None
+
+    def normalize_hs_code(self, hs_code: str) -> str:
+        """HS 코드를 XXXX.XX.XX 형식으로 정규화 (ex 제거, 공백 제거, 10자리 무시)"""
+        if not hs_code:
+            return None
+
+        # 이미 XXXX.XX.XX 정규형이면 그대로 반환 (재실행/멱등 호출 최적화)
+        if (isinstance(hs_code, str) and len(hs_code) == 10
+                and hs_code[4] == '.' and hs_code[7] == '.'
+                and hs_code[:4].isdigit() and hs_code[5:7].isdigit()
+                and hs_code[8:].isdigit()):
+            return hs_code
+
+        # 단일 패스로 추출+검증+포맷 (기존 3회 정규식 + 길이 검사와 동일 결과)
+        m = _HS8_RE.match(str(hs_code))
+        if not m:
+            return None
+        return f"{m[1]}{m[2]}.{m[3]}.{m[4]}"
+
+    def post_process_items(self, items: List[Dict], mip_info: str = None,
+                           doc_case_number: str = None) -> List[Dict]:
+        """추출된 아이템들에 대한 HS 코드 후처리 및 MIP/규정 번호 정보 추가"""
+        processed_items = []
+        
+        for item in items:
+            # 문서 공통 규정 번호로 누락 필드 보충 (LLM 재추출 없이 일관성 확보)
+            if doc_case_number:
+                if not item.get('case_number'):
+                    item['case_number'] = f"(EU) {doc_case_number}"
+                if not item.get('basis_law'):
+                    item['basis_law'] = f"Commission Implementing Regulation (EU) {doc_case_number}"
+
+            # HS 코드 정규화
+            hs_code = item.get('hs_code')
+            if hs_code:
+                normalized_hs = self.normalize_hs_code(hs_code)
+                if normalized_hs:
+                    item['hs_code'] = normalized_hs
+                else:
+                    # 8자리가 아니면 아이템 제외
+                    # 아이템별 핫루프 - print 대신 지연 포맷 logger (기본 레벨에선 no-op)
+                    logger.debug("Skipping invalid HS code: %s", hs_code)
+                    continue
+            
+            # MIP 정보 추가 (note가 비어있는 경우에만)
+            if mip_info and not item.get('note'):
+                item['note'] = f"MIP: {mip_info}"
+            
+            processed_items.append(item)
+        
+        return processed_items
+
+    def process(self, pdf_path: str) -> List[Dict]:
+        """PDF 처리: 페이지 스트리밍으로 MEASURES 섹션만 수집 후 파싱"""
+        from .default_parser import iter_pdf_pages_text
+
+        # 1-3. 페이지를 스트리밍하며 MIP 문장과 MEASURES 섹션을 동시에 수집
+        # 전체 텍스트를 메모리에 올리지 않고, 필요한 30000자가 모이면 조기 종료
+        mip_info = None
+        doc_case_number = None     # 1면 제목의 "(EU) YYYY/NN" 규정 번호
+        candidates = {}            # 그룹 → kept 버퍼 기준 문자 오프셋
+        kept: List[str] = []       # 첫 앵커 페이지부터 보관 ("\n" join 기준 오프셋)
+        kept_chars = 0
+        tail = deque()             # 앵커 미발견 대비 마지막 30000자 폴백 버퍼
+        tail_len = 0
+        total_chars = 0
+
+        for page_text in iter_pdf_pages_text(pdf_path):
+            total_chars += len(page_text)
+
+            # MIP 문장과 규정 번호는 첫 매치만 필요
+            if mip_info is None:
+                mip_info = self.extract_mip_info(page_text)
+            if doc_case_number is None:
+                reg_match = _EU_REGULATION_RE.search(page_text)
+                if reg_match:
+                    doc_case_number = reg_match.group(1)
+
+            # 최우선 앵커(p0)를 찾기 전까지는 모든 페이지를 스캔
+            hits = self._find_measures_hits(page_text) if 'p0' not in candidates else {}
+
+            if kept or hits:
+                page_base = kept_chars + (1 if kept else 0)  # "\n" join 보정
+                kept.append(page_text)
+                kept_chars = page_base + len(page_text)
+                for group, offset in hits.items():
+                    if group not in candidates:
+                        candidates[group] = page_base + offset
+            else:
+                tail.append(page_text)
+                tail_len += len(page_text)
+                while len(tail) > 1 and tail_len - len(tail[0]) >= 30000:
+                    tail_len -= len(tail.popleft())
+
+            # 조기 종료: 최우선 앵커 + MIP 확보 + 필요한 분량 수집 완료
+            if ('p0' in candidates and mip_info is not None
+                    and kept_chars - candidates['p0'] >= 30000):
+                break
+
+        if total_chars < 100:
+            print(f"  💡 Text extraction failed, switching to Vision API")
+            return self.process_image_pdf_with_vision(pdf_path)
+
+        if mip_info:
+            print(f"    📝 Found MIP: {mip_info[:80]}...")
+
+        # MEASURES 섹션 확정 (기존 우선순위 그대로)
+        start = None
+        for group in _MEASURES_PRIORITY:
+            if group in candidates:
+                start = candidates[group]
+                break
+
+        if start is not None:
+            measures_text = "\n".join(kept)[start:start + 30000]
+            print(f"    📝 Extracted MEASURES section ({len(measures_text):,} chars)")
+        else:
+            print(f"    ⚠ ANTI-DUMPING MEASURES section not found, using last 30000 chars")
+            measures_text = "\n".join(tail)[-30000:]
+        
+        # 4. 텍스트가 너무 길면 배치로 나누기
+        max_chars = 100000
+        all_items = []
+
+        if len(measures_text) > max_chars:
+            print(f"  📊 Text too long ({len(measures_text):,} chars), splitting into batches...")
+            # 문자열 += 대신 리스트 누적 + join (O(n²) → O(n))
+            # 페이지는 스트리밍 분할 (전체 페이지 리스트 비생성)
+            pages = iter_pages(measures_text)
+            batch_chunks: List[str] = []
+            batch_len = 0
+            batches: List[str] = []
+
+            for page in pages:
+                if not page.strip():
+                    continue
+                page_text = "--- PAGE " + page if batch_chunks else page
+                if batch_len + len(page_text) > max_chars:
+                    batches.append("\n".join(batch_chunks))
+                    batch_chunks = [page_text]
+                    batch_len = len(page_text)
+                else:
+                    batch_chunks.append(page_text)
+                    batch_len += len(page_text) + 1
+
+            last_batch = "\n".join(batch_chunks)
+            if last_batch.strip():
+                batches.append(last_batch)
+
+            prompt = self.create_extraction_prompt()
+            print(f"  ▶ Processing {len(batches)} batches in parallel...")
+
+            # 배치별 LLM 호출은 서로 독립 → 스레드 병렬화 (네트워크 대기 중 GIL 해제)
+            with ThreadPoolExecutor(max_workers=min(8, len(batches))) as executor:
+                responses = list(executor.map(
+                    lambda batch: self.parse_text_with_llm(batch, prompt),
+                    batches
+                ))
+
+            # 응답 파싱은 순차 처리 (결과 순서 유지)
+            for batch_num, response in enumerate(responses, start=1):
+                items = self.parse_response(response)
+                all_items.extend(items)
+                print(f"  ✓ Batch {batch_num}: {len(items)} items")
+        else:
+            print(f"  ▶ Processing MEASURES section ({len(measures_text):,} chars)...")
+            prompt = self.create_extraction_prompt()
+            response = self.parse_text_with_llm(measures_text, prompt)
+            all_items = self.parse_response(response)
+
+        print(f"  ➜ Total items from all batches: {len(all_items)}")
+        
+        # 5. 후처리 (HS 코드 정규화, MIP/규정 번호 추가)
+        processed_items = self.post_process_items(all_items, mip_info, doc_case_number)
+        
+        print(f"  📝 After post-processing: {len(processed_items)} items")
+        return processed_items
+
+
+# ============================================================================
+# Vision API 버전
+# ============================================================================
+
+class EUVisionParser(VisionBasedParser):
+    """유럽연합 특화 파서 - Vision API 버전"""
+
+    def __init__(self, client):
+        super().__init__(client)
+        self.model_name = "gpt-4.1"  # Vision 모델
+
+    def normalize_hs_code(self, hs_code: str) -> str:
+        """HS 코드를 XXXX.XX.XX 형식으로 정규화 (ex 제거, 공백 제거, 10자리 무시)"""
+        if not hs_code:
+            return None
+
+        # 이미 XXXX.XX.XX 정규형이면 그대로 반환 (재실행/멱등 호출 최적화)
+        if (isinstance(hs_code, str) and len(hs_code) == 10
+                and hs_code[4] == '.' and hs_code[7] == '.'
+                and hs_code[:4].isdigit() and hs_code[5:7].isdigit()
+                and hs_code[8:].isdigit()):
+            return hs_code
+
+        # 단일 패스로 추출+검증+포맷 (기존 3회 정규식 + 길이 검사와 동일 결과)
+        m = _HS8_RE.match(str(hs_code))
+        if not m:
+            return None
+        return f"{m[1]}{m[2]}.{m[3]}.{m[4]}"
+
+    def clean_company_name(self, company: str) -> str:
+        """회사명에서 첫 번째 콤마 앞만 추출"""
+        if not company:
+            return None
+        
+        # 첫 번째 콤마 앞만 추출
+        if ',' in company:
+            company = company.split(',')[0].strip()
+        
+        return company
+
+    def normalize_date(self, date_str: str) -> Optional[str]:
+        """날짜를 YYYY-MM-DD 형식으로 변환 (문서 공통 날짜가 반복되므로 결과 캐시)"""
+        if not date_str:
+            return None
+        return _normalize_date_cached(str(date_str).strip())
+
+    def post_process_items(self, items: List[Dict]) -> List[Dict]:
+        """추출된 아이템들에 대한 후처리"""
+        processed_items = []
+        
+        # 모든 아이템에서 investigation_period 찾기 (첫 번째로 발견된 값 사용)
+        investigation_period_from = None
+        investigation_period_to = None
+        
+        for item in items:
+            # 이중 dict 조회 대신 로컬 바인딩
+            value = item.get('investigation_period_from')
+            if value:
+                investigation_period_from = value
+            value = item.get('investigation_period_to')
+            if value:
+                investigation_period_to = value
+        
+        # investigation_period 날짜 정규화
+        if investigation_period_from:
+            investigation_period_from = self.normalize_date(investigation_period_from)
+        if investigation_period_to:
+            investigation_period_to = self.normalize_date(investigation_period_to)
+        
+        for item in items:
+            # 1. issuing_country 설정
+            if not item.get('issuing_country'):
+                item['issuing_country'] = 'European Union'
+            
+            # 2. HS 코드 정규화
+            hs_code = item.get('hs_code')
+            if hs_code:
+                # 점/공백은 normalize_hs_code의 \D* 가 건너뛰므로 사전 제거 불필요
+                normalized_hs = self.normalize_hs_code(hs_code)
+                if normalized_hs:
+                    item['hs_code'] = normalized_hs
+                else:
+                    # 8자리가 아니면 아이템 제외
+                    continue
+            
+            # 3. 날짜 필드 정규화 (루프 언롤 - 필드당 dict 조회 1회)
+            value = item.get('effective_date_from')
+            if value:
+                item['effective_date_from'] = self.normalize_date(value)
+            value = item.get('effective_date_to')
+            if value:
+                item['effective_date_to'] = self.normalize_date(value)
+            value = item.get('investigation_period_from')
+            if value:
+                item['investigation_period_from'] = self.normalize_date(value)
+            value = item.get('investigation_period_to')
+            if value:
+                item['investigation_period_to'] = self.normalize_date(value)
+            
+            # 4. investigation_period를 모든 아이템에 적용 (공통 값)
+            if investigation_period_from:
+                item['investigation_period_from'] = investigation_period_from
+            if investigation_period_to:
+                item['investigation_period_to'] = investigation_period_to
+            
+            # 5. 세미콜론으로 구분된 회사 분리
+            company = item.get('company')
+            if company and ';' in company:
+                # 세미콜론으로 분리
+                company_parts = [part.strip() for part in company.split(';')]
+                
+                # 각 회사에 대해 새 아이템 생성 (회사명만 변경, 나머지는 복제)
+                # copy() + __setitem__ 대신 단일 dict-build 바이트코드로 생성
+                processed_items.extend(
+                    [{**item, 'company': self.clean_company_name(part)}
+                     for part in company_parts]
+                )
+            else:
+                # 세미콜론이 없으면 회사명만 정리
+                if company:
+                    item['company'] = self.clean_company_name(company)
+                processed_items.append(item)
+        
+        return processed_items
+
+    def process(self, pdf_path: str) -> List[Dict]:
+        """PDF 처리 및 후처리"""
+        # 부모 클래스의 process 호출
+        items = super().process(pdf_path)
+        
+        # 후처리 적용
+        processed_items = self.post_process_items(items)
+        
+        return processed_items
+
+    def create_extraction_prompt(self) -> str:
+        return _EU_VISION_EXTRACTION_PROMPT
+
+
 # ============================================================================
 # 기본 export (하위 호환성)
 # ============================================================================
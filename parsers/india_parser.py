@@ -5,7 +5,6 @@ India Tariff Parser
 
 from .default_parser import DefaultTextParser
 
-
-class IndiaParser(DefaultTextParser):
-    """인도 특화 파서"""
-    pass  # 기본 파서 사용, 필요시 프롬프트 커스터마이징
+# 기본 파서 사용, 필요시 프롬프트 커스터마이징
+# 빈 서브클래스 대신 별칭 사용 (MRO 단축 - 핫패스 속성 조회 비용 절감)
+IndiaParser = DefaultTextParser
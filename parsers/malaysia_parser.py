@@ -4,9 +4,163 @@ Malaysia Tariff Parser
 """
 
 import re
+import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
-from .default_parser import DefaultTextParser, extract_text_from_pdf
-from .base_parser import VisionBasedParser
+from ._items import cartesian_items
+from .default_parser import DefaultTextParser, extract_text_from_pdf, iter_pages
+from .base_parser import VisionBasedParser, _CTRL_TBL, _FENCE_RE, _TRAILING_COMMA_RE
+
+# orjson이 있으면 대형 Vision 응답 파싱에 사용 (json.loads 대비 2-10배), 없으면 표준 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 영어 섹션 마커 5종을 단일 교대 패턴으로 병합 (텍스트 1회 스캔으로 전부 탐지)
+# 그룹 이름 = 우선순위 (k0이 최우선 SCHEDULE)
+_ENGLISH_MARKER_RE = re.compile(
+    r'(?P<k0>SCHEDULE\s*\n)'
+    r'|(?P<k1>ANTI-DUMPING DUTIES)'
+    r'|(?P<k2>COUNTERVAILING DUTIES)'
+    r'|(?P<k3>SAFEGUARD DUTIES)'
+    r'|(?P<k4>\[English Text\])',
+    re.IGNORECASE
+)
+_ENGLISH_MARKER_PRIORITY = ('k0', 'k1', 'k2', 'k3', 'k4')
+
+# 말레이시아 HS 코드 패턴: XXXX.XX.XX XX
+_MY_HS_RE = re.compile(r'\b(\d{4}\.\d{2}\.\d{2}\s+\d{2})\b')
+
+# 철강 품목 HS 코드 접두사 (startswith는 튜플을 받아 C 레벨에서 분기)
+_STEEL_PREFIXES = ('72', '73')
+
+# 비영어 회사명 판별용 문자 집합 (probe 문자별 재스캔 대신 1회 교집합 검사)
+_NON_EN_CHARS = frozenset('的한가')
+
+
+def _company_key(item):
+    """(country, company, tariff_rate) dedup 키
+    LLM 항목은 키가 누락될 수 있어 itemgetter 대신 .get 사용
+    (메서드를 한 번만 바인딩해 항목당 속성 조회 3회 → 1회)
+    """
+    get = item.get
+    return (get('country'), get('company'), get('tariff_rate'))
+
+
+# 추출 프롬프트 상수 (호출마다 거대 리터럴을 재구성하지 않도록 모듈 로드 시 1회 생성)
+_MY_TEXT_EXTRACTION_PROMPT = """Extract tariff information from the Malaysia Anti-Dumping document.
+
+**STEP 1: EXTRACT EFFECTIVE DATES**
+Look for "Citation and commencement" section:
+- Find "shall come into operation on" or "berkuat kuasa pada"
+- Extract the date as effective_date_from (format: YYYY-MM-DD)
+- If there's an end date, extract as effective_date_to
+
+**STEP 2: EXTRACT FROM SCHEDULE / ANTI-DUMPING DUTIES TABLE**
+The table has these columns:
+- (1) Heading No./Subheading → hs_code
+- (2) Description of goods → product_description
+- (3) Country → country
+- (4) Producer/Exporter → company (Roman numerals (i), (ii), (iii) are SEPARATE companies)
+- (5) Rate of Duties → tariff_rate (% or "Nil" = 0)
+
+**COMPANY EXTRACTION RULES:**
+- Roman numerals (i), (ii), (iii), (iv), (v) = SEPARATE companies, extract each one
+- "Others", "Other producers", "Lain-lain" = valid company, include it
+- Alphabetical markers (A), (B), (C) = notes/conditions, NOT companies
+
+**OUTPUT FORMAT:**
+{
+  "effective_date_from": "YYYY-MM-DD or null",
+  "effective_date_to": "YYYY-MM-DD or null",
+  "items": [
+    {
+      "country": "Country name from column (3)",
+      "hs_code": "Code from column (1)",
+      "tariff_type": "Antidumping",
+      "tariff_rate": number from column (5) (0 for Nil),
+      "company": "Company name from column (4)",
+      "product_description": "Description from column (2)",
+      "note": "(A), (B), (C) conditions if any"
+    }
+  ]
+}
+
+**CHECKLIST:**
+- [ ] Extract effective_date_from from "Citation and commencement"
+- [ ] Extract ALL HS codes from column (1)
+- [ ] Extract ALL companies including "Others"
+- [ ] Each company with (i), (ii), (iii) is a SEPARATE item
+- [ ] Convert "Nil" or "0%" to 0
+
+Output ONLY valid JSON.
+"""
+
+_MY_VISION_EXTRACTION_PROMPT = """Extract ALL tariff information from the Malaysia document images.
+
+**CRITICAL - READ CAREFULLY:**
+
+This document has a TABLE structure where:
+- HS Codes appear in COLUMN (1): "Heading No./Subheading Number according to H.S. Code"
+- Companies and tariff rates appear in OTHER COLUMNS
+
+**STEP 1: EXTRACT ALL HS CODES FROM COLUMN (1)**
+- HS codes look like: XXXX.XX.XX XX (e.g., 7210.49.11 00, 7212.30.11 00)
+- They are steel product codes starting with 72 or 73
+- SCAN EVERY visible HS code — there are typically 15-20 different codes
+- Include the 2-digit suffix after the space (e.g., "00" or "10")
+- List EVERY unique code in the "hs_codes" array, do NOT skip any
+
+**STEP 2: EXTRACT EFFECTIVE DATES**
+Look for "Citation and commencement" section:
+- Find "shall come into operation on" or "berkuat kuasa pada"
+- Extract date as effective_date_from (format: YYYY-MM-DD)
+
+**STEP 3: EXTRACT FROM SCHEDULE / ANTI-DUMPING DUTIES TABLE**
+The table has these columns:
+- (1) Heading No./Subheading → hs_code (e.g., 7210.49.11 00)
+- (2) Description of goods → product_description
+- (3) Country → country
+- (4) Producer/Exporter → company (Roman numerals are SEPARATE companies)
+- (5) Rate of Duties → tariff_rate
+
+**COMPANY EXTRACTION RULES:**
+- (i), (ii), (iii), (iv) = SEPARATE companies, each must be extracted
+- "Others", "Other producers", "Other producer or exporter" = valid company, MUST include
+- Alphabetical markers (A), (B), (C) = notes/conditions, NOT company names
+
+**OUTPUT FORMAT:**
+{
+  "effective_date_from": "YYYY-MM-DD or null",
+  "effective_date_to": "YYYY-MM-DD or null",
+  "hs_codes": [
+    "7210.49.11 00",
+    "7210.49.12 00"
+  ],
+  "items": [
+    {
+      "country": "Country from column (3)",
+      "hs_code": "Code from column (1) or null",
+      "tariff_type": "Antidumping",
+      "tariff_rate": number from column (5) (0 for Nil),
+      "company": "Company from column (4)",
+      "product_description": "Description from column (2)",
+      "note": "(A), (B), (C) conditions if any"
+    }
+  ]
+}
+
+**IMPORTANT CHECKLIST:**
+- [ ] Extract EVERY HS code from column (1) into "hs_codes"
+- [ ] Extract effective_date_from from "Citation and commencement"
+- [ ] Extract EVERY company including "Others"
+- [ ] Each company with (i), (ii), (iii) is a SEPARATE item
+- [ ] Convert "Nil" tariff rates to 0
+
+Output ONLY valid JSON."""
 
 
 # ============================================================================
@@ -16,42 +170,49 @@ from .base_parser import VisionBasedParser
 class MalaysiaTextParser(DefaultTextParser):
     """말레이시아 특화 파서 - OCR 버전 (HS Code × Company 조합 자동 생성)"""
 
-    def extract_english_section(self, text: str) -> str:
+    def __init__(self, client, vision_parser=None):
+        super().__init__(client)
+        # 폴백용 Vision 파서 주입 지원 (하이브리드 경로에서 인스턴스/캐시 재사용)
+        self._vision_parser = vision_parser
+
+    def extract_english_section(self, text: str) -> int:
         """
-        말레이시아 PDF에서 영어 섹션만 추출
+        말레이시아 PDF에서 영어 섹션 시작 오프셋 반환
         - 'SCHEDULE' 또는 'ANTI-DUMPING DUTIES' 이후 부분만 사용
+        - 수 MB 텍스트의 앞부분을 잘라 복사하는 대신 (text, offset)으로 작업
         """
-        markers = [
-            r'SCHEDULE\s*\n',
-            r'ANTI-DUMPING DUTIES',
-            r'COUNTERVAILING DUTIES',
-            r'SAFEGUARD DUTIES',
-            r'\[English Text\]',
-        ]
-        
-        for marker in markers:
-            match = re.search(marker, text, re.IGNORECASE)
-            if match:
-                english_text = text[match.start():]
-                print(f"    📝 Extracted English section starting from '{marker}' ({len(english_text):,} chars)")
-                return english_text
+        # 마커별 최초 출현 위치를 한 번의 스캔으로 수집
+        # (우선순위가 낮은 마커가 먼저 나와도 우선순위 높은 마커를 계속 탐색)
+        hits = {}
+        for match in _ENGLISH_MARKER_RE.finditer(text):
+            group = match.lastgroup
+            if group not in hits:
+                hits[group] = match.start()
+                if group == _ENGLISH_MARKER_PRIORITY[0]:
+                    break  # 최우선 마커(SCHEDULE) 발견 → 더 볼 필요 없음
+
+        for group in _ENGLISH_MARKER_PRIORITY:
+            if group in hits:
+                start = hits[group]
+                print(f"    📝 Extracted English section starting from marker {group} ({len(text) - start:,} chars)")
+                return start
         
         print(f"    ⚠ No English marker found, using full text")
-        return text
+        return 0
 
     def extract_hs_codes(self, text: str) -> List[str]:
         """텍스트에서 말레이시아 형식 HS Code 추출 (XXXX.XX.XX XX)"""
+        # set으로 중복 검사 O(1), 리스트는 발견 순서 유지용
+        seen = set()
         hs_codes = []
-        
-        # 말레이시아 HS 코드 패턴: XXXX.XX.XX XX
-        pattern = r'\b(\d{4}\.\d{2}\.\d{2}\s+\d{2})\b'
-        matches = re.findall(pattern, text)
-        
+
+        matches = _MY_HS_RE.findall(text)
+
         for code in matches:
             # 72XX 또는 73XX로 시작하는 철강 관련 코드만
-            if code.startswith('72') or code.startswith('73'):
-                if code not in hs_codes:
-                    hs_codes.append(code)
+            if code.startswith(_STEEL_PREFIXES) and code not in seen:
+                seen.add(code)
+                hs_codes.append(code)
         
         if hs_codes:
             print(f"    📝 Found {len(hs_codes)} unique HS codes")
@@ -63,22 +224,16 @@ class MalaysiaTextParser(DefaultTextParser):
         if not hs_codes:
             return items
         
-        expanded = []
         unique_companies = {}  # (country, company, rate) -> item template
         
-        # 고유한 회사/국가/비율 조합 추출
+        # 고유한 회사/국가/비율 조합 추출 (setdefault = 조회+삽입 1회, 최초 항목 유지)
+        # 템플릿은 변형하지 않으므로 .copy() 불필요 (행별 dict는 아래 unpack에서 새로 생성)
         for item in items:
-            key = (item.get('country'), item.get('company'), item.get('tariff_rate'))
-            if key not in unique_companies:
-                unique_companies[key] = item.copy()
-        
-        # 각 HS Code × 각 회사 조합 생성
-        for hs_code in hs_codes:
-            for key, template in unique_companies.items():
-                new_item = template.copy()
-                new_item['hs_code'] = hs_code
-                expanded.append(new_item)
+            unique_companies.setdefault(_company_key(item), item)
         
+        # 각 HS Code × 각 회사 조합 생성 (공용 헬퍼 - 발견 순서 유지)
+        expanded = cartesian_items(hs_codes, unique_companies.values())
+
         print(f"    📊 Expanded: {len(unique_companies)} companies × {len(hs_codes)} HS codes = {len(expanded)} items")
         return expanded
 
@@ -87,14 +242,16 @@ class MalaysiaTextParser(DefaultTextParser):
         processed = []
         
         for item in items:
+            get = item.get  # 메서드 1회 바인딩 (항목당 속성 조회 절감)
+
             # Nil → 0
-            rate = item.get('tariff_rate')
+            rate = get('tariff_rate')
             if rate is None or (isinstance(rate, str) and rate.lower() == 'nil'):
                 item['tariff_rate'] = 0
             
             # 테이블에 없는 잘못된 회사명 필터링 (영어가 아닌 경우 등)
-            company = item.get('company', '')
-            if company and any(char in company for char in ['的', '한', '가']):
+            company = get('company', '')
+            if company and _NON_EN_CHARS.intersection(company):
                 continue  # 비영어 회사명 제외
             
             processed.append(item)
@@ -102,63 +259,20 @@ class MalaysiaTextParser(DefaultTextParser):
         return processed
 
     def create_extraction_prompt(self) -> str:
-        return """Extract tariff information from the Malaysia Anti-Dumping document.
-
-**STEP 1: EXTRACT EFFECTIVE DATES**
-Look for "Citation and commencement" section:
-- Find "shall come into operation on" or "berkuat kuasa pada"
-- Extract the date as effective_date_from (format: YYYY-MM-DD)
-- If there's an end date, extract as effective_date_to
-
-**STEP 2: EXTRACT FROM SCHEDULE / ANTI-DUMPING DUTIES TABLE**
-The table has these columns:
-- (1) Heading No./Subheading → hs_code
-- (2) Description of goods → product_description
-- (3) Country → country
-- (4) Producer/Exporter → company (Roman numerals (i), (ii), (iii) are SEPARATE companies)
-- (5) Rate of Duties → tariff_rate (% or "Nil" = 0)
-
-**COMPANY EXTRACTION RULES:**
-- Roman numerals (i), (ii), (iii), (iv), (v) = SEPARATE companies, extract each one
-- "Others", "Other producers", "Lain-lain" = valid company, include it
-- Alphabetical markers (A), (B), (C) = notes/conditions, NOT companies
-
-**OUTPUT FORMAT:**
-{
-  "effective_date_from": "YYYY-MM-DD or null",
-  "effective_date_to": "YYYY-MM-DD or null",
-  "items": [
-    {
-      "country": "Country name from column (3)",
-      "hs_code": "Code from column (1)",
-      "tariff_type": "Antidumping",
-      "tariff_rate": number from column (5) (0 for Nil),
-      "company": "Company name from column (4)",
-      "product_description": "Description from column (2)",
-      "note": "(A), (B), (C) conditions if any"
-    }
-  ]
-}
-
-**CHECKLIST:**
-- [ ] Extract effective_date_from from "Citation and commencement"
-- [ ] Extract ALL HS codes from column (1)
-- [ ] Extract ALL companies including "Others"
-- [ ] Each company with (i), (ii), (iii) is a SEPARATE item
-- [ ] Convert "Nil" or "0%" to 0
-
-Output ONLY valid JSON.
-"""
+        return _MY_TEXT_EXTRACTION_PROMPT
 
     def process(self, pdf_path: str) -> List[Dict]:
         """PDF 처리: HS Code 추출 + Company 파싱 + 조합 생성"""
+        # 하이브리드 폴백이 재활용할 수 있도록 이전 실행의 HS 코드 초기화
+        self._last_hs_codes = []
+
         # 1. 텍스트 추출
         text = extract_text_from_pdf(pdf_path)
 
         if text is None or len(text) < 100:
             print(f"  💡 Switching to Vision API for image-based PDF")
-            # MalaysiaVisionParser의 2단계 추출 사용
-            vision_parser = MalaysiaVisionParser(self.client)
+            # 주입된 인스턴스가 있으면 재사용 (중복 생성 방지)
+            vision_parser = self._vision_parser or MalaysiaVisionParser(self.client)
             return vision_parser.process(pdf_path)
 
         if not text:
@@ -166,47 +280,60 @@ Output ONLY valid JSON.
 
         # 2. 전체 텍스트에서 HS Code 추출
         all_hs_codes = self.extract_hs_codes(text)
+        self._last_hs_codes = all_hs_codes
 
-        # 3. 영어 섹션만 추출
-        english_text = self.extract_english_section(text)
+        # 3. 영어 섹션 시작 오프셋만 계산 (복사 없음)
+        english_start = self.extract_english_section(text)
+        english_len = len(text) - english_start
 
         # 4. LLM으로 회사/비율 파싱 (HS Code는 코드로 처리)
         max_chars = 50000
         all_items = []
 
-        if len(english_text) > max_chars:
-            print(f"  📊 Text too long ({len(english_text):,} chars), splitting into batches...")
-            pages = english_text.split("\n--- PAGE ")
-            batch_text = ""
-            batch_num = 1
+        if english_len > max_chars:
+            print(f"  📊 Text too long ({english_len:,} chars), splitting into batches...")
+            pages = iter_pages(text, english_start)
+            # 문자열 += 대신 리스트 누적 + join (O(n²) → O(n))
+            batch_chunks: List[str] = []
+            batch_len = 0
+            batches: List[str] = []
 
             for page in pages:
                 if not page.strip():
                     continue
-                page_text = "--- PAGE " + page if batch_text else page
-                if len(batch_text) + len(page_text) > max_chars:
-                    print(f"  ▶ Processing batch {batch_num} ({len(batch_text):,} chars)...")
-                    prompt = self.create_extraction_prompt()
-                    response = self.parse_text_with_llm(batch_text, prompt)
-                    items = self.parse_response(response)
-                    all_items.extend(items)
-                    print(f"  ✓ Batch {batch_num}: {len(items)} items")
-                    batch_text = page_text
-                    batch_num += 1
+                page_text = "--- PAGE " + page if batch_chunks else page
+                if batch_len + len(page_text) > max_chars:
+                    batches.append("\n".join(batch_chunks))
+                    batch_chunks = [page_text]
+                    batch_len = len(page_text)
                 else:
-                    batch_text += "\n" + page_text
+                    batch_chunks.append(page_text)
+                    batch_len += len(page_text) + 1
+
+            # 마지막 배치
+            last_batch = "\n".join(batch_chunks)
+            if last_batch.strip():
+                batches.append(last_batch)
+
+            prompt = self.create_extraction_prompt()
+            print(f"  ▶ Processing {len(batches)} batches in parallel...")
+
+            # 배치별 LLM 호출은 서로 독립 → 스레드 병렬화 (워커 4개로 rate limit 배려)
+            with ThreadPoolExecutor(max_workers=min(4, len(batches))) as executor:
+                responses = list(executor.map(
+                    lambda batch: self.parse_text_with_llm(batch, prompt),
+                    batches
+                ))
 
-            if batch_text.strip():
-                print(f"  ▶ Processing batch {batch_num} ({len(batch_text):,} chars)...")
-                prompt = self.create_extraction_prompt()
-                response = self.parse_text_with_llm(batch_text, prompt)
+            # 응답 파싱은 순차 처리 (결과 순서 유지)
+            for batch_num, response in enumerate(responses, start=1):
                 items = self.parse_response(response)
                 all_items.extend(items)
                 print(f"  ✓ Batch {batch_num}: {len(items)} items")
         else:
-            print(f"  ▶ Processing English section ({len(english_text):,} chars)...")
+            print(f"  ▶ Processing English section ({english_len:,} chars)...")
             prompt = self.create_extraction_prompt()
-            response = self.parse_text_with_llm(english_text, prompt)
+            response = self.parse_text_with_llm(text[english_start:], prompt)
             all_items = self.parse_response(response)
 
         print(f"  ➜ Total items from LLM: {len(all_items)}")
@@ -230,13 +357,14 @@ class MalaysiaVisionParser(VisionBasedParser):
 
     def extract_hs_codes_from_vision_response(self, items: List[Dict]) -> List[str]:
         """Vision API 응답에서 고유 HS Code 추출"""
+        seen = set()
         hs_codes = []
         for item in items:
             hs = item.get('hs_code')
-            if hs and hs not in hs_codes:
-                # 72XX 또는 73XX 철강 코드만
-                if str(hs).startswith('72') or str(hs).startswith('73'):
-                    hs_codes.append(hs)
+            # 72XX 또는 73XX 철강 코드만 (set으로 중복 검사 O(1))
+            if hs and hs not in seen and str(hs).startswith(_STEEL_PREFIXES):
+                seen.add(hs)
+                hs_codes.append(hs)
         return hs_codes
 
     def expand_hs_codes(self, items: List[Dict], hs_codes: List[str]) -> List[Dict]:
@@ -244,26 +372,22 @@ class MalaysiaVisionParser(VisionBasedParser):
         if not hs_codes:
             return items
         
-        expanded = []
         unique_companies = {}
         
         for item in items:
-            key = (item.get('country'), item.get('company'), item.get('tariff_rate'))
-            if key not in unique_companies:
-                unique_companies[key] = item.copy()
-        
-        for hs_code in hs_codes:
-            for key, template in unique_companies.items():
-                new_item = template.copy()
-                new_item['hs_code'] = hs_code
-                expanded.append(new_item)
+            unique_companies.setdefault(_company_key(item), item)
         
+        expanded = cartesian_items(hs_codes, unique_companies.values())
+
         print(f"    📊 Expanded: {len(unique_companies)} companies × {len(hs_codes)} HS codes = {len(expanded)} items")
         return expanded
 
-    def process(self, pdf_path: str) -> List[Dict]:
-        """Vision API 처리 - 2단계 추출 (HS Code 전용 + Company/Rate)"""
-        print(f"  🖼️  Processing image-based PDF with Vision API (2-pass)...")
+    def process(self, pdf_path: str, seed_hs_codes: List[str] = None) -> List[Dict]:
+        """
+        Vision API 처리 - 단일 패스 추출 (HS Code + Company/Rate 동시)
+        seed_hs_codes: 텍스트 파서가 이미 찾아둔 HS 코드 (하이브리드 폴백 시 재사용)
+        """
+        print(f"  🖼️  Processing image-based PDF with Vision API (single-pass)...")
         
         # PDF를 이미지로 변환
         page_imgs = self.get_pdf_page_images(pdf_path)
@@ -272,71 +396,59 @@ class MalaysiaVisionParser(VisionBasedParser):
 
         total_pages = len(page_imgs)
         BATCH_PAGE_LIMIT = 10
-        
-        # ============================================================
-        # PASS 1: HS Code 전용 추출 (더 정확한 추출을 위해 분리)
-        # ============================================================
-        print(f"  [Pass 1] Extracting HS Codes...")
-        all_hs_codes: List[str] = []
-        hs_instruction = self._create_hs_code_only_prompt()
-        
-        for start in range(0, total_pages, BATCH_PAGE_LIMIT):
-            end = min(start + BATCH_PAGE_LIMIT, total_pages)
-            batch = page_imgs[start:end]
-            batch_page_nums = [p for p, _ in batch]
-            print(f"    ▶ Pages {batch_page_nums[0]}–{batch_page_nums[-1]}")
 
-            b64_list = [b64 for _, b64 in batch]
-            response = self.call_vision_api(hs_instruction, b64_list)
-            
-            # HS 코드 파싱
-            parsed = self._parse_vision_response(response)
-            batch_hs = parsed.get('hs_codes', [])
-            
-            for hs in batch_hs:
-                if hs and hs not in all_hs_codes:
-                    # 72XX 또는 73XX 철강 코드만
-                    if str(hs).startswith('72') or str(hs).startswith('73'):
-                        all_hs_codes.append(hs)
-            
-            print(f"    ✓ Found {len(batch_hs)} HS codes in this batch")
-        
-        print(f"  ➜ Pass 1 complete: {len(all_hs_codes)} unique HS codes")
-        if all_hs_codes:
-            print(f"    📝 {all_hs_codes}")
-        
-        # ============================================================
-        # PASS 2: Company/Rate 추출
-        # ============================================================
-        print(f"  [Pass 2] Extracting Companies and Rates...")
+        batches = [
+            page_imgs[start:start + BATCH_PAGE_LIMIT]
+            for start in range(0, total_pages, BATCH_PAGE_LIMIT)
+        ]
+        # 배치별 Vision 호출은 독립 → 스레드 병렬화 (워커 4개로 rate limit 배려)
+        max_workers = min(4, len(batches))
+
+        # HS Code와 Company/Rate를 한 프롬프트로 동시 추출
+        # (패스 분리 대비 이미지 업로드/토큰 비용 절반)
+        print(f"  ▶ Extracting HS Codes + Companies ({len(batches)} batches, {max_workers} workers)...")
+        all_hs_seen = set()  # 배치 간 공유 중복 검사 set
+        all_hs_codes: List[str] = []
         all_items: List[Dict] = []
-        company_instruction = self.create_extraction_prompt()
-        
-        for start in range(0, total_pages, BATCH_PAGE_LIMIT):
-            end = min(start + BATCH_PAGE_LIMIT, total_pages)
-            batch = page_imgs[start:end]
+
+        # 텍스트 경로에서 넘겨받은 HS 코드를 먼저 반영 (Vision이 놓쳐도 보존)
+        if seed_hs_codes:
+            for hs in seed_hs_codes:
+                if hs and hs not in all_hs_seen and str(hs).startswith(_STEEL_PREFIXES):
+                    all_hs_seen.add(hs)
+                    all_hs_codes.append(hs)
+            print(f"    📝 Seeded {len(all_hs_codes)} HS codes from text parser")
+
+        instruction = self.create_extraction_prompt()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses = list(executor.map(
+                lambda batch: self.call_vision_api(instruction, [b64 for _, b64 in batch]),
+                batches
+            ))
+
+        # 응답 파싱은 순차 처리 (배치 순서 = 페이지 순서 유지)
+        for batch, response in zip(batches, responses):
             batch_page_nums = [p for p, _ in batch]
             print(f"    ▶ Pages {batch_page_nums[0]}–{batch_page_nums[-1]}")
 
-            b64_list = [b64 for _, b64 in batch]
-            response = self.call_vision_api(company_instruction, b64_list)
-            
-            # Items 파싱
             parsed = self._parse_vision_response(response)
             items = parsed.get('items', [])
             all_items.extend(items)
+
+            batch_hs = parsed.get('hs_codes', [])
+            for hs in batch_hs:
+                # 72XX 또는 73XX 철강 코드만
+                if hs and hs not in all_hs_seen and str(hs).startswith(_STEEL_PREFIXES):
+                    all_hs_seen.add(hs)
+                    all_hs_codes.append(hs)
             
-            # 혹시 Pass 1에서 못 찾은 HS 코드가 있으면 추가
-            extra_hs = parsed.get('hs_codes', [])
-            for hs in extra_hs:
-                if hs and hs not in all_hs_codes:
-                    if str(hs).startswith('72') or str(hs).startswith('73'):
-                        all_hs_codes.append(hs)
-            
-            print(f"    ✓ Found {len(items)} items in this batch")
+            print(f"    ✓ Found {len(items)} items, {len(batch_hs)} HS codes in this batch")
 
-        print(f"  ➜ Pass 2 complete: {len(all_items)} items")
+        print(f"  ➜ Extraction complete: {len(all_items)} items")
         print(f"  ➜ Total HS codes: {len(all_hs_codes)}")
+        if all_hs_codes:
+            print(f"    📝 {all_hs_codes}")
         
         # HS Code × Company 조합 생성
         if all_hs_codes:
@@ -351,61 +463,17 @@ class MalaysiaVisionParser(VisionBasedParser):
         
         return all_items
     
-    def _create_hs_code_only_prompt(self) -> str:
-        """HS 코드만 전용 추출하는 프롬프트"""
-        return """Extract ALL HS codes from this Malaysia tariff document.
-
-**YOUR ONLY TASK: Find and list ALL HS codes.**
-
-LOOK FOR:
-- The table column "(1) Heading/Subheading Number according to H.S. Code"
-- HS codes look like: XXXX.XX.XX XX (e.g., 7210.49.11 00, 7212.30.11 00)
-- They are steel product codes starting with 72 or 73
-
-SCAN EVERY visible HS code in the document images.
-There are typically 15-20 different HS codes.
-
-OUTPUT FORMAT:
-{
-  "hs_codes": [
-    "7210.49.11 00",
-    "7210.49.12 00",
-    "7210.49.19 00",
-    "7210.61.11 00",
-    "7210.61.12 00",
-    "7212.30.11 00",
-    "7212.30.12 00"
-  ],
-  "items": []
-}
-
-IMPORTANT:
-- List EVERY unique HS code you can see
-- Include the 2-digit suffix after space (e.g., "00" or "10")  
-- Do NOT skip any codes
-- Output ONLY valid JSON"""
-
     def _parse_vision_response(self, response: str) -> Dict:
         """Vision API 응답 파싱 - hs_codes와 items 둘 다 추출"""
-        import re
-        import json
-        
         if not response:
             return {'hs_codes': [], 'items': []}
 
-        # 제어 문자 제거
-        response = ''.join(
-            char for char in response
-            if ord(char) >= 32 or char in '\n\t\r'
-        )
+        # 제어 문자 제거 (translate는 C 레벨 단일 패스 - 문자별 제너레이터 대비 수십 배 빠름)
+        response = response.translate(_CTRL_TBL)
 
         # ```json 블럭 처리
         if '```' in response:
-            json_match = re.search(
-                r'```(?:json)?\s*\n(.*?)\n```',
-                response,
-                re.DOTALL
-            )
+            json_match = _FENCE_RE.search(response)
             if json_match:
                 response = json_match.group(1)
 
@@ -417,14 +485,15 @@ IMPORTANT:
                 response = response[first_brace:]
 
         # 콤마 정리
-        response = re.sub(r',(\s*[}\]])', r'\1', response)
+        response = _TRAILING_COMMA_RE.sub(r'\1', response)
 
-        # 중괄호 짝 맞추기
+        # 중괄호 짝 맞추기 (Counter로 4회 전체 스캔 → 1회)
         if not response.rstrip().endswith('}'):
-            open_braces = response.count('{')
-            close_braces = response.count('}')
-            open_brackets = response.count('[')
-            close_brackets = response.count(']')
+            counts = Counter(response)
+            open_braces = counts['{']
+            close_braces = counts['}']
+            open_brackets = counts['[']
+            close_brackets = counts[']']
 
             if close_brackets < open_brackets:
                 response += ']' * (open_brackets - close_brackets)
@@ -432,82 +501,30 @@ IMPORTANT:
                 response += '}' * (open_braces - close_braces)
 
         try:
-            data = json.loads(response)
+            data = orjson.loads(response) if orjson else json.loads(response)
             hs_codes = data.get('hs_codes', [])
             items = data.get('items', [])
             print(f"    ✓ Parsed {len(items)} items, {len(hs_codes)} HS codes")
             return {'hs_codes': hs_codes, 'items': items}
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # orjson.JSONDecodeError와 json.JSONDecodeError 모두 ValueError 하위
             print(f"  ⚠ JSON decode error: {e}")
             return {'hs_codes': [], 'items': []}
 
     def create_extraction_prompt(self) -> str:
-        return """Extract ALL tariff information from the Malaysia document images.
-
-**CRITICAL - READ CAREFULLY:**
-
-This document has a TABLE structure where:
-- HS Codes appear in COLUMN (1): "Heading No./Subheading Number according to H.S. Code"
-- Companies and tariff rates appear in OTHER COLUMNS
-
-**STEP 1: EXTRACT EFFECTIVE DATES**
-Look for "Citation and commencement" section:
-- Find "shall come into operation on" or "berkuat kuasa pada"
-- Extract date as effective_date_from (format: YYYY-MM-DD)
-
-**STEP 2: EXTRACT FROM SCHEDULE / ANTI-DUMPING DUTIES TABLE**
-The table has these columns:
-- (1) Heading No./Subheading → hs_code (e.g., 7210.49.11 00)
-- (2) Description of goods → product_description
-- (3) Country → country
-- (4) Producer/Exporter → company (Roman numerals are SEPARATE companies)
-- (5) Rate of Duties → tariff_rate
-
-**COMPANY EXTRACTION RULES:**
-- (i), (ii), (iii), (iv) = SEPARATE companies, each must be extracted
-- "Others", "Other producers", "Other producer or exporter" = valid company, MUST include
-- Alphabetical markers (A), (B), (C) = notes/conditions, NOT company names
-
-**OUTPUT FORMAT:**
-{
-  "effective_date_from": "YYYY-MM-DD or null",
-  "effective_date_to": "YYYY-MM-DD or null",
-  "hs_codes": [
-    "7210.49.11 00",
-    "7210.49.12 00"
-  ],
-  "items": [
-    {
-      "country": "Country from column (3)",
-      "hs_code": "Code from column (1) or null",
-      "tariff_type": "Antidumping",
-      "tariff_rate": number from column (5) (0 for Nil),
-      "company": "Company from column (4)",
-      "product_description": "Description from column (2)",
-      "note": "(A), (B), (C) conditions if any"
-    }
-  ]
-}
-
-**IMPORTANT CHECKLIST:**
-- [ ] Extract effective_date_from from "Citation and commencement"
-- [ ] Extract EVERY HS code from column (1)
-- [ ] Extract EVERY company including "Others"
-- [ ] Each company with (i), (ii), (iii) is a SEPARATE item
-- [ ] Convert "Nil" tariff rates to 0
-
-Output ONLY valid JSON."""
+        return _MY_VISION_EXTRACTION_PROMPT
 
 
 # ============================================================================
 # 하이브리드 파서 (텍스트 → 실패 시 Vision 폴백)
 # ============================================================================
-class MalaysiaHybridParser(DefaultTextParser):
+class MalaysiaHybridParser(MalaysiaTextParser):
     """Malaysia 문서: 텍스트 파서 먼저 → 실패 시 Vision 폴백"""
 
     def __init__(self, client):
-        super().__init__(client)
+        # 텍스트 경로의 이미지 PDF 폴백과 하이브리드 폴백이 같은 인스턴스를 공유
         self._vision = MalaysiaVisionParser(client)
+        super().__init__(client, vision_parser=self._vision)
 
     def process(self, pdf_path: str):
         print("  [Hybrid] Trying TEXT parser first...")
@@ -522,10 +539,13 @@ class MalaysiaHybridParser(DefaultTextParser):
             print(f"  ✓ TEXT parser success: {len(text_items)} items")
             return text_items
 
-        # 실패 시 Vision 폴백
+        # 실패 시 Vision 폴백 (텍스트 경로가 찾아둔 HS 코드는 시드로 전달)
         print("  ⚠ TEXT parser failed → Switching to VISION parser...")
         try:
-            vision_items = self._vision.process(pdf_path)
+            vision_items = self._vision.process(
+                pdf_path,
+                seed_hs_codes=getattr(self, '_last_hs_codes', None)
+            )
             print(f"  ✓ VISION parser success: {len(vision_items)} items")
             return vision_items
         except Exception as e:
@@ -3,79 +3,16 @@ Pakistan Tariff Parser
 파키스탄 관세 정보 파서
 """
 
+import hashlib
+import logging
 from typing import Dict, List
+from ._items import cartesian_items
 from .default_parser import DefaultTextParser
 
+logger = logging.getLogger(__name__)
 
-class PakistanParser(DefaultTextParser):
-    """파키스탄 특화 파서"""
-
-    def process(self, pdf_path: str) -> List[Dict]:
-        """
-        PDF 처리 후 모든 HS Code × 국가 조합을 강제 생성
-        LLM이 불완전한 조합을 반환해도 Python에서 완전한 Cartesian product 생성
-        """
-        # 기본 파서로 먼저 추출
-        items = super().process(pdf_path)
-        
-        if not items:
-            return items
-        
-        # 모든 고유 HS 코드 수집
-        all_hs_codes = set()
-        for item in items:
-            if item.get('hs_code'):
-                all_hs_codes.add(item['hs_code'])
-        
-        # 국가별 정보 수집 (tariff_rate 등)
-        country_info = {}
-        for item in items:
-            country = item.get('country')
-            if country and country not in country_info:
-                country_info[country] = {
-                    'tariff_rate': item.get('tariff_rate'),
-                    'tariff_type': item.get('tariff_type'),
-                    'effective_date_from': item.get('effective_date_from'),
-                    'effective_date_to': item.get('effective_date_to'),
-                    'investigation_period_from': item.get('investigation_period_from'),
-                    'investigation_period_to': item.get('investigation_period_to'),
-                    'basis_law': item.get('basis_law'),
-                    'case_number': item.get('case_number'),
-                    'product_description': item.get('product_description'),
-                    'note': item.get('note'),
-                    'company': item.get('company'),
-                }
-        
-        print(f"  📊 Found {len(all_hs_codes)} unique HS codes")
-        print(f"  📊 Found {len(country_info)} countries: {list(country_info.keys())}")
-        
-        # Cartesian product 생성: 모든 HS Code × 모든 국가
-        complete_items = []
-        for hs_code in sorted(all_hs_codes):
-            for country, info in country_info.items():
-                complete_items.append({
-                    'country': country,
-                    'hs_code': hs_code,
-                    'tariff_type': info.get('tariff_type'),
-                    'tariff_rate': info.get('tariff_rate'),
-                    'effective_date_from': info.get('effective_date_from'),
-                    'effective_date_to': info.get('effective_date_to'),
-                    'investigation_period_from': info.get('investigation_period_from'),
-                    'investigation_period_to': info.get('investigation_period_to'),
-                    'basis_law': info.get('basis_law'),
-                    'company': info.get('company'),
-                    'case_number': info.get('case_number'),
-                    'product_description': info.get('product_description'),
-                    'note': info.get('note'),
-                })
-        
-        expected_count = len(all_hs_codes) * len(country_info)
-        print(f"  ✓ Generated {len(complete_items)} items ({len(all_hs_codes)} HS codes × {len(country_info)} countries = {expected_count})")
-        
-        return complete_items
-
-    def create_extraction_prompt(self) -> str:
-        return """Extract tariff/trade remedy information from the Pakistan Anti-Dumping document.
+# 추출 프롬프트 상수 (호출마다 메서드 디스패치로 리터럴을 재반환하는 비용 제거)
+_PAKISTAN_EXTRACTION_PROMPT = """Extract tariff/trade remedy information from the Pakistan Anti-Dumping document.
 
 **DOCUMENT STRUCTURE:**
 - The document contains a list of HS codes and their tariff rates by country
@@ -149,3 +86,74 @@ Create 6 items:
 
 Output ONLY valid JSON.
 """
+
+# 프롬프트 버전 식별자 - 프롬프트가 바뀌면 값도 바뀌므로 캐시 키 구성 요소로 사용 가능
+PROMPT_SHA = hashlib.sha256(_PAKISTAN_EXTRACTION_PROMPT.encode()).hexdigest()[:16]
+
+# 국가별로 복제되는 항목 필드 (수집과 템플릿 구성이 같은 키 목록을 공유)
+_INFO_KEYS = (
+    'tariff_rate',
+    'tariff_type',
+    'effective_date_from',
+    'effective_date_to',
+    'investigation_period_from',
+    'investigation_period_to',
+    'basis_law',
+    'case_number',
+    'product_description',
+    'note',
+    'company',
+)
+
+
+class PakistanParser(DefaultTextParser):
+    """파키스탄 특화 파서"""
+
+    def process(self, pdf_path: str) -> List[Dict]:
+        """
+        PDF 처리 후 모든 HS Code × 국가 조합을 강제 생성
+        LLM이 불완전한 조합을 반환해도 Python에서 완전한 Cartesian product 생성
+        """
+        # 기본 파서로 먼저 추출
+        items = super().process(pdf_path)
+        
+        if not items:
+            return items
+        
+        # 모든 고유 HS 코드 수집
+        all_hs_codes = set()
+        for item in items:
+            if item.get('hs_code'):
+                all_hs_codes.add(item['hs_code'])
+        
+        # 국가별 정보 수집 (tariff_rate 등)
+        country_info = {}
+        for item in items:
+            country = item.get('country')
+            if country and country not in country_info:
+                country_info[country] = {k: item.get(k) for k in _INFO_KEYS}
+        
+        logger.info("  📊 Found %d unique HS codes", len(all_hs_codes))
+        if logger.isEnabledFor(logging.INFO):
+            # 레벨이 꺼져 있으면 국가 리스트 구성 자체를 생략
+            logger.info("  📊 Found %d countries: %s", len(country_info), list(country_info))
+        
+        # 국가별 템플릿을 1회 구성 (조합마다 .get 13회 대신 C 레벨 dict 복사 1회)
+        country_templates = [
+            {'country': country, **info}
+            for country, info in country_info.items()
+        ]
+
+        # Cartesian product 생성: 모든 HS Code × 모든 국가
+        complete_items = cartesian_items(sorted(all_hs_codes), country_templates)
+        
+        logger.info(
+            "  ✓ Generated %d items (%d HS codes × %d countries = %d)",
+            len(complete_items), len(all_hs_codes), len(country_info),
+            len(all_hs_codes) * len(country_info)
+        )
+        
+        return complete_items
+
+    def create_extraction_prompt(self) -> str:
+        return _PAKISTAN_EXTRACTION_PROMPT
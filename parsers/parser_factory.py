@@ -3,6 +3,8 @@ Parser Factory
 파일명 및 모드에 따라 적절한 파서를 생성
 """
 
+import os
+
 from openai import OpenAI
 from .base_parser import TextBasedParser, VisionBasedParser
 from .default_parser import DefaultTextParser
@@ -16,6 +18,67 @@ from .canada_parser import CanadaParser
 from .turkey_parser import TurkeyParser
 from .pakistan_parser import PakistanParser
 
+# 모드 → (text, vision, hybrid) 튜플 인덱스
+_MODE_INDEX = {'ocr': 0, 'vision': 1, 'hybrid': 2}
+
+# 단일 라우트 테이블: 파일명 태그 → ((TextCls, VisionCls, HybridCls), 발행국)
+# 튜플 순서 = 기존 if/elif 우선순위 (USA_가 US_보다 먼저)
+# Vision/Hybrid 전용 클래스가 없는 국가는 해당 슬롯에 기존 폴백 클래스를 그대로 둠
+_ROUTES = (
+    ('USA_', (USATextParser, USAVisionParser, USAHybridParser), 'United States'),
+    ('US_', (USATextParser, USAVisionParser, USAHybridParser), 'United States'),
+    ('EU_', (EUTextParser, EUVisionParser, EUTextParser), 'European Union'),
+    ('MALAYSIA_', (MalaysiaTextParser, MalaysiaVisionParser, MalaysiaHybridParser), 'Malaysia'),
+    ('AUSTRALIA_', (AustraliaTextParser, AustraliaVisionParser, AustraliaTextParser), 'Australia'),
+    ('BRAZIL_', (BrazilParser, BrazilParser, BrazilParser), 'Brazil'),
+    ('INDIA_', (IndiaParser, IndiaParser, IndiaParser), 'India'),
+    ('CANADA_', (CanadaParser, CanadaParser, CanadaParser), 'Canada'),
+    ('TURKEY_', (TurkeyParser, TurkeyParser, TurkeyParser), 'Turkey'),
+    ('PAKISTAN_', (PakistanParser, PakistanParser, PakistanParser), 'Pakistan'),
+)
+_PARSER_ROUTES = tuple((tag, classes) for tag, classes, _ in _ROUTES)
+_PARSER_BY_TAG = {tag: classes for tag, classes, _ in _ROUTES}
+
+# pyahocorasick이 있으면 폴백 태그 탐색을 단일 선형 스캔으로 (없으면 순차 in 탐색)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+if ahocorasick is not None:
+    _TAG_AUTOMATON = ahocorasick.Automaton()
+    for _tag, _ in _PARSER_ROUTES:
+        _TAG_AUTOMATON.add_word(_tag, _tag)
+    _TAG_AUTOMATON.make_automaton()
+else:
+    _TAG_AUTOMATON = None
+
+# 튜플 순서 = 태그 우선순위 (USA_가 US_보다 먼저)
+_TAG_PRIORITY = {tag: i for i, (tag, _) in enumerate(_PARSER_ROUTES)}
+
+# 파일명 태그 → 발행국 (라우트 테이블에서 파생)
+_COUNTRY_BY_TAG = {tag: country for tag, _, country in _ROUTES}
+
+
+def _find_tag(file_name_upper: str):
+    """파일명에서 국가 태그 탐색 - 접두사는 O(1) dict 조회, 아니면 우선순위 순 부분 탐색"""
+    prefix_tag = file_name_upper.split('_', 1)[0] + '_'
+    if prefix_tag in _PARSER_BY_TAG:
+        return prefix_tag
+
+    # 태그가 파일명 중간에 있는 경우 (기존 if/elif와 동일한 우선순위로 탐색)
+    if _TAG_AUTOMATON is not None:
+        # 1회 스캔으로 등장 태그 전부 수집 후 우선순위가 가장 높은 것 선택
+        found = {tag for _, tag in _TAG_AUTOMATON.iter(file_name_upper)}
+        if found:
+            return min(found, key=_TAG_PRIORITY.__getitem__)
+        return None
+
+    for tag, _ in _PARSER_ROUTES:
+        if tag in file_name_upper:
+            return tag
+    return None
+
 
 class ParserFactory:
     """파서 팩토리 - 파일명과 모드에 따라 적절한 파서 생성"""
@@ -37,98 +100,25 @@ class ParserFactory:
         Returns:
             적절한 파서 인스턴스
         """
-        file_name_upper = file_name.upper()
+        # 경로 전체가 아니라 파일명만 대문자화 (긴 경로의 불필요한 복사 방지)
+        file_name_upper = os.path.basename(file_name).upper()
         mode = mode.lower()
 
-        if mode not in ["ocr", "vision", "hybrid"]:
+        if mode not in _MODE_INDEX:
             print(f"  ⚠ Invalid mode '{mode}', defaulting to 'hybrid'")
             mode = "hybrid"
 
-        # 국가별 파서 매핑
-        if 'USA_' in file_name_upper or 'US_' in file_name_upper:
-            if mode == "vision":
-                print("  Using USA Vision Parser")
-                return USAVisionParser(client)
-            elif mode == "hybrid":
-                print("  Using USA Hybrid Parser (Text → Vision Fallback)")
-                return USAHybridParser(client)
-            else:  # ocr
-                print("  Using USA Text Parser (OCR)")
-                return USATextParser(client)
-
-        elif 'EU_' in file_name_upper:
-            if mode == "vision":
-                print("  Using EU Vision Parser")
-                return EUVisionParser(client)
-            else:  # ocr or hybrid
-                print("  Using EU Text Parser (OCR)")
-                return EUTextParser(client)
-
-        elif 'MALAYSIA_' in file_name_upper:
-            if mode == "vision":
-                print("  Using Malaysia Vision Parser")
-                return MalaysiaVisionParser(client)
-            elif mode == "hybrid":
-                print("  Using Malaysia Hybrid Parser (Text → Vision Fallback)")
-                return MalaysiaHybridParser(client)
-            else:  # ocr
-                print("  Using Malaysia Text Parser (OCR)")
-                return MalaysiaTextParser(client)
-
-        elif 'AUSTRALIA_' in file_name_upper:
-            if mode == "vision":
-                print("  Using Australia Vision Parser")
-                return AustraliaVisionParser(client)
-            else:  # ocr or hybrid
-                print("  Using Australia Text Parser (OCR)")
-                return AustraliaTextParser(client)
-
-        elif 'BRAZIL_' in file_name_upper:
-            print(f"  Using Brazil Parser ({'Vision' if mode == 'vision' else 'OCR'})")
-            return BrazilParser(client)
-
-        elif 'INDIA_' in file_name_upper:
-            print(f"  Using India Parser ({'Vision' if mode == 'vision' else 'OCR'})")
-            return IndiaParser(client)
-
-        elif 'CANADA_' in file_name_upper:
-            print(f"  Using Canada Parser ({'Vision' if mode == 'vision' else 'OCR'})")
-            return CanadaParser(client)
-
-        elif 'TURKEY_' in file_name_upper:
-            print(f"  Using Turkey Parser ({'Vision' if mode == 'vision' else 'OCR'})")
-            return TurkeyParser(client)
-
-        elif 'PAKISTAN_' in file_name_upper:
-            print(f"  Using Pakistan Parser ({'Vision' if mode == 'vision' else 'OCR'})")
-            return PakistanParser(client)
-
-        else:
+        tag = _find_tag(file_name_upper)
+        if tag is None:
             print(f"  Using Default Parser ({'Vision' if mode == 'vision' else 'OCR'})")
             return DefaultTextParser(client)
 
+        parser_class = _PARSER_BY_TAG[tag][_MODE_INDEX[mode]]
+        print(f"  Using {parser_class.__name__} (mode={mode})")
+        return parser_class(client)
+
     @staticmethod
     def detect_issuing_country(file_name: str) -> str:
         """파일명에서 발행국 추론"""
-        file_name_upper = file_name.upper()
-
-        if 'USA_' in file_name_upper or 'US_' in file_name_upper:
-            return "United States"
-        elif 'MALAYSIA_' in file_name_upper:
-            return "Malaysia"
-        elif 'EU_' in file_name_upper:
-            return "European Union"
-        elif 'BRAZIL_' in file_name_upper:
-            return "Brazil"
-        elif 'AUSTRALIA_' in file_name_upper:
-            return "Australia"
-        elif 'PAKISTAN_' in file_name_upper:
-            return "Pakistan"
-        elif 'INDIA_' in file_name_upper:
-            return "India"
-        elif 'TURKEY_' in file_name_upper:
-            return "Turkey"
-        elif 'CANADA_' in file_name_upper:
-            return "Canada"
-        else:
-            return "Unknown"
+        tag = _find_tag(os.path.basename(file_name).upper())
+        return _COUNTRY_BY_TAG.get(tag, "Unknown")
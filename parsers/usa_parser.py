@@ -3,226 +3,117 @@ USA Tariff Parser
 미국 관세 정보 파서 - OCR + Vision API 하이브리드 버전
 """
 
+import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List
-from .default_parser import DefaultTextParser
-from .base_parser import VisionBasedParser
 
+import fitz  # PyMuPDF
 
-def validate_usa_hs_code(hs_code) -> str:
+try:
+    import httpx  # openai 클라이언트의 전송 계층
+except ImportError:
+    httpx = None
+from ._items import cartesian_items
+from .default_parser import DefaultTextParser, extract_text_from_pdf, iter_pages
+from .base_parser import VisionBasedParser
+
+logger = logging.getLogger(__name__)
+
+# google-re2가 있으면 대용량 텍스트 스캔에 DFA 기반 선형 시간 매칭 사용
+# (백트래킹 없는 리터럴 프리필터 - 없으면 표준 re로 동작 동일)
+try:
+    import re2 as _hs_re_impl
+except ImportError:
+    _hs_re_impl = re
+
+# 모듈 로드 시 1회 컴파일 (페이지/호출마다 re 캐시 조회 방지)
+# 72XX/73XX 철강 HS 코드: XXXX.XX.XX ~ XXXX.XX.XXXX
+_USA_HS_RE = _hs_re_impl.compile(r'7[23]\d{2}\.\d{2}\.\d{2,4}')
+# 케이스 번호: A-XXX-XXX (반덤핑) / C-XXX-XXX (상계관세)
+_USA_CASE_RE = re.compile(r'[AC]-\d{3}-\d{3}')
+
+# pyahocorasick이 있으면 HS 코드 후보를 단일 선형 스캔으로 탐색 (없으면 re.findall)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+if ahocorasick is not None:
+    # 유효 4자리 프리픽스(7200~7399) 자동자 - 후보 위치만 찾고 접미부는 문자 검사
+    _HS_PREFIX_AUTOMATON = ahocorasick.Automaton()
+    for _ch in '23':
+        for _n in range(100):
+            _prefix = f'7{_ch}{_n:02d}'
+            _HS_PREFIX_AUTOMATON.add_word(_prefix, _prefix)
+    _HS_PREFIX_AUTOMATON.make_automaton()
+else:
+    _HS_PREFIX_AUTOMATON = None
+
+
+def _scan_hs_codes(text: str) -> set:
     """
-    미국 철강 제품 HS 코드 검증
-    - 72XX, 73XX로 시작하는 코드만 유효
-    - 텍스트나 잘못된 형식은 null 처리
+    텍스트에서 철강 HS 코드(7[23]XX.XX.XX~XXXX) 전부 수집
+    자동자가 있으면 프리픽스 1회 스캔 + 접미부 문자 검사, 없으면 정규식 스캔
     """
-    if not hs_code or hs_code == "null":
-        return None
-
-    hs_code_str = str(hs_code).strip()
-
-    # 알파벳이 포함되어 있으면 무효 (CORE, Truck and Bus 등)
-    if re.search(r'[a-zA-Z]', hs_code_str):
-        return None
-
-    # 72 또는 73으로 시작하지 않으면 무효
-    if not re.match(r'^7[23]', hs_code_str):
-        return None
-
-    # 유효한 형식인지 확인: XXXX.XX.XX 또는 XXXX.XX.XXXX
-    if not re.match(r'^\d{4}\.\d{2}\.?\d{0,4}$', hs_code_str):
-        return None
-
-    return hs_code_str
-
-
-# ============================================================================
-# OCR 기반 미국 파서
-# ============================================================================
-class USATextParser(DefaultTextParser):
-    """미국 특화 텍스트 파서"""
-
-    def extract_hs_codes_from_pdf(self, pdf_path: str) -> set:
-        """PDF에서 모든 HS Code를 직접 추출 (72XX, 73XX로 시작하는 것만)"""
-        import fitz
-        all_hs_codes = set()
-        
-        try:
-            doc = fitz.open(pdf_path)
-            for page in doc:
-                text = page.get_text()
-                # 72XX 또는 73XX로 시작하는 HS 코드 찾기
-                hs_codes = re.findall(r'7[23]\d{2}\.\d{2}\.\d{2,4}', text)
-                all_hs_codes.update(hs_codes)
-            doc.close()
-        except Exception as e:
-            print(f"    ⚠ Error extracting HS codes from PDF: {e}")
-        
-        return all_hs_codes
-
-    def extract_case_number_from_filename(self, pdf_path: str) -> str:
-        """파일명에서 Case Number 추출 (A-XXX-XXX 또는 C-XXX-XXX)"""
-        import os
-        filename = os.path.basename(pdf_path)
-        # A-580-881 또는 C-580-888 형태 찾기
-        match = re.search(r'([AC]-\d{3}-\d{3})', filename)
-        if match:
-            return match.group(1)
-        return None
-
-    def extract_case_section(self, text: str, case_number: str) -> str:
-        """텍스트에서 특정 Case Number 섹션만 추출"""
-        if not case_number:
-            return text
-        
-        # Case Number 패턴: A-580-881 등
-        pattern = re.escape(case_number)
-        
-        # Case Number가 나타나는 위치 찾기
-        match = re.search(pattern, text, re.IGNORECASE)
-        if not match:
-            print(f"    ⚠ Case number {case_number} not found in text")
-            return text
-        
-        # 해당 Case Number부터 시작
-        start_pos = match.start()
-        section_text = text[start_pos:]
-        
-        # 다음 다른 Case Number가 나타나면 거기까지만 추출
-        # A-XXX-XXX 또는 C-XXX-XXX 형태의 다른 케이스 번호 찾기
-        next_case_pattern = r'[AC]-\d{3}-\d{3}'
-        for next_match in re.finditer(next_case_pattern, section_text[20:]):  # 처음 20자 이후부터 검색
-            next_case = next_match.group()
-            if next_case != case_number:
-                end_pos = next_match.start() + 20
-                section_text = section_text[:end_pos]
-                print(f"    📑 Extracted section for {case_number} ({len(section_text):,} chars)")
-                break
-        
-        return section_text
-
-    def process(self, pdf_path: str) -> List[Dict]:
-        """
-        PDF 처리 후 모든 HS Code × 국가/회사 조합을 강제 생성
-        """
-        # 0. 파일명에서 Case Number 추출
-        target_case_number = self.extract_case_number_from_filename(pdf_path)
-        if target_case_number:
-            print(f"  🔍 Target case number: {target_case_number}")
-        
-        # 1. PDF에서 모든 HS Code 직접 추출
-        all_hs_codes = self.extract_hs_codes_from_pdf(pdf_path)
-        print(f"  📊 Found {len(all_hs_codes)} unique HS codes in PDF")
-        
-        # 2. 기본 파서로 LLM 추출 실행
-        items = super().process(pdf_path)
-        
-        if not items:
-            return items
-        
-        # 3. PDF에서 직접 추출한 HS Code만 사용 (LLM 생성 HS Code는 무시)
-        # PDF에 HTSUS 섹션이 없으면 HS Code 없이 회사 정보만 저장
-        if not all_hs_codes:
-            print(f"  📊 No HS codes in PDF, setting hs_code to null for all {len(items)} items")
-            # HS 코드를 null로 설정
-            for item in items:
-                item['hs_code'] = None
-            return self._deduplicate_items(items)
-        
-        # 5. 국가/회사별 정보 수집
-        country_company_info = {}
-        for item in items:
-            country = item.get('country')
-            company = item.get('company')
-            
-            if not country:
-                continue
-            
-            key = (country, company)
-            if key not in country_company_info:
-                country_company_info[key] = {
-                    'tariff_rate': item.get('tariff_rate'),
-                    'tariff_type': item.get('tariff_type'),
-                    'effective_date_from': item.get('effective_date_from'),
-                    'effective_date_to': item.get('effective_date_to'),
-                    'investigation_period_from': item.get('investigation_period_from'),
-                    'investigation_period_to': item.get('investigation_period_to'),
-                    'basis_law': item.get('basis_law'),
-                    'case_number': item.get('case_number'),
-                    'product_description': item.get('product_description'),
-                    'note': item.get('note'),
-                }
-        
-        print(f"  📊 Found {len(country_company_info)} unique country/company combinations")
-        
-        # 6. Cartesian product 생성: 모든 HS Code × 모든 국가/회사
-        complete_items = []
-        for hs_code in sorted(all_hs_codes):
-            for (country, company), info in country_company_info.items():
-                complete_items.append({
-                    'country': country,
-                    'company': company,
-                    'hs_code': hs_code,
-                    'tariff_type': info.get('tariff_type'),
-                    'tariff_rate': info.get('tariff_rate'),
-                    'effective_date_from': info.get('effective_date_from'),
-                    'effective_date_to': info.get('effective_date_to'),
-                    'investigation_period_from': info.get('investigation_period_from'),
-                    'investigation_period_to': info.get('investigation_period_to'),
-                    'basis_law': info.get('basis_law'),
-                    'case_number': info.get('case_number'),
-                    'product_description': info.get('product_description'),
-                    'note': info.get('note'),
-                })
-        
-        expected_count = len(all_hs_codes) * len(country_company_info)
-        print(f"  ✓ Generated {len(complete_items)} items ({len(all_hs_codes)} HS codes × {len(country_company_info)} country/company = {expected_count})")
-        
-        return complete_items
-
-    def _deduplicate_items(self, items: List[Dict]) -> List[Dict]:
-        """중복 제거"""
-        seen = set()
-        unique_items = []
-        for item in items:
-            # 중복 판단 키: hs_code, country, company, tariff_rate
-            key = (
-                item.get('hs_code'),
-                item.get('country'),
-                item.get('company'),
-                item.get('tariff_rate')
-            )
-            if key not in seen:
-                seen.add(key)
-                unique_items.append(item)
-        
-        if len(items) != len(unique_items):
-            print(f"    ✓ Removed {len(items) - len(unique_items)} duplicate items")
-        
-        return unique_items
-
-    def parse_response(self, response: str) -> List[Dict]:
-        """JSON 파싱 + HS 코드 검증 + 중복 제거"""
-        items = super().parse_response(response)
-
-        # HS 코드 검증 및 정리
-        invalid_count = 0
-        for item in items:
-            if 'hs_code' in item:
-                original_hs = item['hs_code']
-                validated_hs = validate_usa_hs_code(original_hs)
-                if original_hs != validated_hs:
-                    print(f"    ⚠ Invalid HS code filtered: '{original_hs}' → null")
-                    invalid_count += 1
-                item['hs_code'] = validated_hs
-
-        if invalid_count > 0:
-            print(f"    ✓ Filtered {invalid_count} invalid HS codes")
-
-        return self._deduplicate_items(items)
-
-    def create_extraction_prompt(self) -> str:
-        return """Extract tariff/trade remedy information from the US document text.
-
+    if _HS_PREFIX_AUTOMATON is None:
+        return set(_USA_HS_RE.findall(text))
+
+    found = set()
+    text_len = len(text)
+    last_end = 0
+    for end_idx, prefix in _HS_PREFIX_AUTOMATON.iter(text):
+        start = end_idx - 3
+        # re.findall과 같은 비중첩 매칭 (직전 매치 내부의 프리픽스는 건너뜀)
+        if start < last_end:
+            continue
+        # 접미부 검사: .XX.XX ~ .XX.XXXX
+        if start + 10 > text_len:
+            continue
+        if text[start + 4] != '.' or text[start + 7] != '.':
+            continue
+        if not (text[start + 5].isdigit() and text[start + 6].isdigit()):
+            continue
+        end = start + 8
+        stop = min(start + 12, text_len)
+        while end < stop and text[end].isdigit():
+            end += 1
+        if end - (start + 8) < 2:
+            continue
+        found.add(text[start:end])
+        last_end = end
+    return found
+
+# 하이브리드 폴백을 타야 하는 복구 가능 오류만 잡음 (그 외 버그는 그대로 전파)
+# - FileDataError: 손상/비정상 PDF, ValueError: JSON 파싱 실패(orjson 포함), OSError: 파일 I/O
+_RECOVERABLE_ERRORS = (
+    getattr(fitz, 'FileDataError', RuntimeError),
+    ValueError,
+    OSError,
+)
+if httpx is not None:
+    _RECOVERABLE_ERRORS += (httpx.HTTPError,)
+
+# 국가/회사별로 복제되는 항목 필드 (수집과 템플릿 구성이 같은 키 목록을 공유)
+_INFO_KEYS = (
+    'tariff_rate',
+    'tariff_type',
+    'effective_date_from',
+    'effective_date_to',
+    'investigation_period_from',
+    'investigation_period_to',
+    'basis_law',
+    'case_number',
+    'product_description',
+    'note',
+)
+
+# 추출 프롬프트 (모듈 로드 시 1회 조립 - 문서마다 같은 객체 반환)
+# 텍스트/Vision 프롬프트가 공유하는 규칙은 한 정의에서 내려받음
+# 주의: 조립 결과 바이트가 바뀌면 프롬프트 해시 기반 디스크 캐시가 무효화됨
+_USA_COMMON_RULES = """
 **CRITICAL INSTRUCTIONS:**
 
 **DOCUMENT LAYOUT:**
@@ -236,7 +127,12 @@ class USATextParser(DefaultTextParser):
    - ONLY read the main body text and tables
    - If a footnote contains company names, dates, or rates, IGNORE them
 
-1. **CASE NUMBER SECTION PARSING - VERY IMPORTANT:**
+"""
+
+_USA_TEXT_PROMPT = (
+    "Extract tariff/trade remedy information from the US document text.\n"
+    + _USA_COMMON_RULES
+    + """1. **CASE NUMBER SECTION PARSING - VERY IMPORTANT:**
    - The document may contain MULTIPLE case number sections
    - Parse ONLY the section that matches the case number you are looking for
    - Case numbers are in format: A-XXX-XXX or C-XXX-XXX (e.g., A-580-881, C-580-888)
@@ -305,51 +201,12 @@ OUTPUT JSON FORMAT:
 
 Output ONLY JSON.
 """
+)
 
-
-# ============================================================================
-# Vision 기반 미국 파서
-# ============================================================================
-class USAVisionParser(VisionBasedParser):
-    """미국 특화 Vision API 파서"""
-
-    def parse_response(self, response: str) -> List[Dict]:
-        """JSON 파싱 + HS 코드 검증"""
-        items = super().parse_response(response)
-
-        # HS 코드 검증 및 정리
-        invalid_count = 0
-        for item in items:
-            if 'hs_code' in item:
-                original_hs = item['hs_code']
-                validated_hs = validate_usa_hs_code(original_hs)
-                if original_hs != validated_hs:
-                    print(f"    ⚠ Invalid HS code filtered: '{original_hs}' → null")
-                    invalid_count += 1
-                item['hs_code'] = validated_hs
-
-        if invalid_count > 0:
-            print(f"    ✓ Filtered {invalid_count} invalid HS codes")
-
-        return items
-
-    def create_extraction_prompt(self) -> str:
-        return """Extract tariff/trade remedy information from the US document images.
-
-**CRITICAL INSTRUCTIONS:**
-
-**DOCUMENT LAYOUT:**
-- US documents have 3 columns, read from LEFT to RIGHT
-- Within each column, read from TOP to BOTTOM
-- Read Column 1 (leftmost) completely, then Column 2 (middle), then Column 3 (rightmost)
-
-0. **IGNORE FOOTNOTES - VERY IMPORTANT:**
-   - DO NOT read or extract data from footnotes
-   - Footnotes are small text at the bottom of pages, often numbered (1, 2, 3...) or with symbols
-   - ONLY read the main body text and tables
-   - If a footnote contains company names, dates, or rates, IGNORE them
-
-1. **DEPARTMENT OF COMMERCE Section Parsing:**
+_USA_VISION_PROMPT = (
+    "Extract tariff/trade remedy information from the US document images.\n"
+    + _USA_COMMON_RULES
+    + """1. **DEPARTMENT OF COMMERCE Section Parsing:**
    - Read from where "DEPARTMENT OF COMMERCE" title appears until the next "DEPARTMENT OF COMMERCE"
    - Check if the section is "Final Results" or "Preliminary Results" after "DEPARTMENT OF COMMERCE"
    - Add "Final Results" or "Preliminary Results" to the note field
@@ -434,43 +291,257 @@ OUTPUT JSON FORMAT:
 - Use ONLY information visible in the images
 - Output ONLY JSON, no explanatory text.
 """
+)
 
 
-# ============================================================================
-# 하이브리드 파서 (텍스트 → 실패 시 Vision 폴백)
-# ============================================================================
-class USAHybridParser(DefaultTextParser):
-    """미국 문서: 텍스트 파서 먼저 → 실패 시 Vision 폴백"""
+def validate_hs_codes_inplace(items) -> int:
+    """
+    항목 배치의 hs_code를 일괄 검증해 제자리 수정 (무효 → None)
+    반환: 무효 처리된 개수
+    - 검증 함수를 루프 로컬로 바인딩해 항목당 조회 비용 최소화
+    - DataFrame 왕복은 None 비율 필드를 NaN으로 오염시켜 사용하지 않음
+    """
+    validate = validate_usa_hs_code
+    invalid_count = 0
+    for item in items:
+        if 'hs_code' not in item:
+            continue
+        original_hs = item['hs_code']
+        validated_hs = validate(original_hs)
+        if original_hs != validated_hs:
+            # 항목별 메시지는 debug로 (stdout 플러시가 검증 자체보다 비쌈)
+            logger.debug("Invalid HS code filtered: %r → null", original_hs)
+            invalid_count += 1
+        item['hs_code'] = validated_hs
+
+    if invalid_count > 0:
+        logger.info("    ✓ Filtered %d invalid HS codes", invalid_count)
+    return invalid_count
 
-    def __init__(self, client):
-        super().__init__(client)
-        self._vision = USAVisionParser(client)
+
+def validate_usa_hs_code(hs_code) -> str:
+    """
+    미국 철강 제품 HS 코드 검증 (순수 문자 검사 - 정규식 엔진 미사용)
+    - 유효 형식: 7[23]XX.XX + 선택적 ('.' 생략 가능) 0~4자리 숫자
+    - 72XX, 73XX로 시작하는 코드만 유효, 그 외는 null 처리
+    - Cartesian 확장으로 같은 코드가 수백 번 반복되므로 결과를 LRU 캐시
+    """
+    if not hs_code or hs_code == "null":
+        return None
+    return _validate_cached(str(hs_code).strip())
+
+
+@lru_cache(maxsize=4096)
+def _validate_cached(s: str) -> str:
+    n = len(s)
+    # 최소 "7210.49"(7자) ~ 최대 "7210.49.0030"(12자)
+    if n < 7 or n > 12 or not s.isascii():
+        return None
+    if s[0] != '7' or s[1] not in '23' or s[4] != '.':
+        return None
+    if not (s[2].isdigit() and s[3].isdigit() and s[5].isdigit() and s[6].isdigit()):
+        return None
+
+    # 접미부: 선택적 '.' + 0~4자리 숫자
+    rest = s[7:]
+    if rest.startswith('.'):
+        rest = rest[1:]
+    if rest and (len(rest) > 4 or not rest.isdigit()):
+        return None
+
+    return s
+
+
+class _HSValidationMixin:
+    """
+    parse_response 뒤 HS 코드 일괄 검증을 공유하는 믹스인
+    - 세 파서에 복붙돼 있던 동일 루프를 한 곳으로 (최적화 지점 단일화)
+    - MRO상 기반 파서보다 앞에 두면 super().parse_response 결과에 검증 적용
+    """
 
     def parse_response(self, response: str) -> List[Dict]:
-        """JSON 파싱 + HS 코드 검증"""
+        """JSON 파싱 + HS 코드 검증 (요약 로그는 헬퍼가 출력)"""
         items = super().parse_response(response)
+        validate_hs_codes_inplace(items)
+        return items
+
+
+# ============================================================================
+# OCR 기반 미국 파서
+# ============================================================================
+class USATextParser(_HSValidationMixin, DefaultTextParser):
+    """미국 특화 텍스트 파서"""
+
+    def extract_hs_codes_from_pdf(self, pdf_path: str) -> set:
+        """PDF에서 모든 HS Code를 직접 추출 (72XX, 73XX로 시작하는 것만)"""
+        # 본문용 extract_text_from_pdf와 같은 lru_cache 텍스트를 공유
+        # → process()에서 문서를 두 번 열고 순회하던 것을 1회로 축소
+        text = extract_text_from_pdf(pdf_path)
+        if not text:
+            return set()
+
+        # HTSUS 목록은 문서 앞쪽 한 섹션에 몰려 있음
+        # → 새 코드가 안 나오는 페이지가 연속 10장이면 조기 종료 (스캔 바이트 절감)
+        all_hs_codes = set()
+        stale = 0
+        for page in iter_pages(text):
+            new_codes = _scan_hs_codes(page) - all_hs_codes
+            if new_codes:
+                all_hs_codes.update(new_codes)
+                stale = 0
+            elif all_hs_codes:
+                stale += 1
+                if stale >= 10:
+                    break
+        return all_hs_codes
+
+    def extract_case_number_from_filename(self, pdf_path: str) -> str:
+        """파일명에서 Case Number 추출 (A-XXX-XXX 또는 C-XXX-XXX)"""
+        filename = os.path.basename(pdf_path)
+        # A-580-881 또는 C-580-888 형태 찾기
+        match = _USA_CASE_RE.search(filename)
+        if match:
+            return match.group(0)
+        return None
+
+    def extract_case_section(self, text: str, case_number: str) -> str:
+        """텍스트에서 특정 Case Number 섹션만 추출"""
+        if not case_number:
+            return text
+        
+        # 케이스 번호 출현 위치를 finditer 1회로 전부 수집 (대상 탐색 + 경계 탐색 공용)
+        matches = [(m.start(), m.group(0)) for m in _USA_CASE_RE.finditer(text)]
+        target = case_number.upper()
+
+        target_idx = None
+        for i, (pos, case) in enumerate(matches):
+            if case.upper() == target:
+                target_idx = i
+                break
+
+        if target_idx is None:
+            print(f"    ⚠ Case number {case_number} not found in text")
+            return text
+
+        # 해당 Case Number부터 다음 다른 케이스 번호 직전까지
+        start_pos = matches[target_idx][0]
+        end_pos = len(text)
+        for pos, case in matches[target_idx + 1:]:
+            if case != case_number:
+                end_pos = pos
+                print(f"    📑 Extracted section for {case_number} ({end_pos - start_pos:,} chars)")
+                break
+        
+        return text[start_pos:end_pos]
+
+    def process(self, pdf_path: str) -> List[Dict]:
+        """
+        PDF 처리 후 모든 HS Code × 국가/회사 조합을 강제 생성
+        """
+        # 0. 파일명에서 Case Number 추출
+        target_case_number = self.extract_case_number_from_filename(pdf_path)
+        if target_case_number:
+            print(f"  🔍 Target case number: {target_case_number}")
+        
+        # 1. PDF에서 모든 HS Code 직접 추출
+        all_hs_codes = self.extract_hs_codes_from_pdf(pdf_path)
+        logger.info("  📊 Found %d unique HS codes in PDF", len(all_hs_codes))
+        
+        # 2. 기본 파서로 LLM 추출 실행
+        items = super().process(pdf_path)
+        
+        if not items:
+            return items
+        
+        # 3. PDF에서 직접 추출한 HS Code만 사용 (LLM 생성 HS Code는 무시)
+        # PDF에 HTSUS 섹션이 없으면 HS Code 없이 회사 정보만 저장
+        if not all_hs_codes:
+            logger.info("  📊 No HS codes in PDF, setting hs_code to null for all %d items", len(items))
+            # HS 코드를 null로 설정
+            for item in items:
+                item['hs_code'] = None
+            return self._deduplicate_items(items)
+        
+        # 5. 국가/회사별 정보 수집
+        country_company_info = {}
+        for item in items:
+            country = item.get('country')
+            company = item.get('company')
+            
+            if not country:
+                continue
+            
+            key = (country, company)
+            if key not in country_company_info:
+                country_company_info[key] = {k: item.get(k) for k in _INFO_KEYS}
+        
+        logger.info("  📊 Found %d unique country/company combinations", len(country_company_info))
+        
+        # 6. Cartesian product 생성: 모든 HS Code × 모든 국가/회사
+        # 국가/회사별 템플릿 1회 구성 → 조합마다 .get 13회 대신 C 레벨 dict 복사 1회
+        templates = [
+            {'country': country, 'company': company, **info}
+            for (country, company), info in country_company_info.items()
+        ]
+        complete_items = cartesian_items(sorted(all_hs_codes), templates)
+        
+        logger.info(
+            "  ✓ Generated %d items (%d HS codes × %d country/company = %d)",
+            len(complete_items), len(all_hs_codes), len(country_company_info),
+            len(all_hs_codes) * len(country_company_info)
+        )
+        
+        return complete_items
 
-        # HS 코드 검증 및 정리
-        invalid_count = 0
+    def _deduplicate_items(self, items: List[Dict]) -> List[Dict]:
+        """중복 제거 (삽입 순서 보존 dict 1개로 set+list 이중 관리 대체)"""
+        by_key = {}
         for item in items:
-            if 'hs_code' in item:
-                original_hs = item['hs_code']
-                validated_hs = validate_usa_hs_code(original_hs)
-                if original_hs != validated_hs:
-                    print(f"    ⚠ Invalid HS code filtered: '{original_hs}' → null")
-                    invalid_count += 1
-                item['hs_code'] = validated_hs
+            # 중복 판단 키: hs_code, country, company, tariff_rate
+            # (메서드 1회 바인딩으로 항목당 속성 조회 4회 → 1회)
+            get = item.get
+            key = (get('hs_code'), get('country'), get('company'), get('tariff_rate'))
+            if key not in by_key:
+                by_key[key] = item
+        
+        if len(items) != len(by_key):
+            print(f"    ✓ Removed {len(items) - len(by_key)} duplicate items")
+        
+        return list(by_key.values())
 
-        if invalid_count > 0:
-            print(f"    ✓ Filtered {invalid_count} invalid HS codes")
+    def parse_response(self, response: str) -> List[Dict]:
+        """JSON 파싱 + HS 코드 검증(믹스인) + 중복 제거"""
+        return self._deduplicate_items(super().parse_response(response))
+
+    def create_extraction_prompt(self) -> str:
+        return _USA_TEXT_PROMPT
+
+
+# ============================================================================
+# Vision 기반 미국 파서
+# ============================================================================
+class USAVisionParser(_HSValidationMixin, VisionBasedParser):
+    """미국 특화 Vision API 파서"""
+
+    def create_extraction_prompt(self) -> str:
+        return _USA_VISION_PROMPT
 
-        return items
+
+# ============================================================================
+# 하이브리드 파서 (텍스트 → 실패 시 Vision 폴백)
+# ============================================================================
+class USAHybridParser(_HSValidationMixin, DefaultTextParser):
+    """미국 문서: 텍스트 파서 먼저 → 실패 시 Vision 폴백"""
+
+    def __init__(self, client):
+        super().__init__(client)
+        self._vision = USAVisionParser(client)
 
     def process(self, pdf_path: str):
         print("  [Hybrid] Trying TEXT parser first...")
         try:
             text_items = super().process(pdf_path)
-        except Exception as e:
+        except _RECOVERABLE_ERRORS as e:
             print(f"  ✗ TEXT parser crashed: {e}")
             text_items = []
 
@@ -485,7 +556,7 @@ class USAHybridParser(DefaultTextParser):
             vision_items = self._vision.process(pdf_path)
             print(f"  ✓ VISION parser success: {len(vision_items)} items")
             return vision_items
-        except Exception as e:
+        except _RECOVERABLE_ERRORS as e:
             print(f"  ✗ Vision parser also failed: {e}")
             return []
 
@@ -494,3 +565,23 @@ class USAHybridParser(DefaultTextParser):
 # 외부에서 불러올 때 기본값: 하이브리드 파서
 # ============================================================================
 USAParser = USAHybridParser
+
+
+def parse_batch(pdf_paths: List[str], client, max_workers: int = None) -> List[List[Dict]]:
+    """
+    여러 PDF를 병렬 파싱 (입력 순서대로 문서별 항목 리스트 반환)
+    - 지배 비용이 LLM 네트워크 대기라 스레드 풀 사용
+      (프로세스 풀은 OpenAI 클라이언트가 pickle 불가 + 직렬화 비용만 추가)
+    - 파서 인스턴스는 스레드별로 생성 (파서 상태는 인스턴스 단위)
+    """
+    if not pdf_paths:
+        return []
+    if max_workers is None:
+        # LLM 레이트 리밋 고려해 4개 상한 (배치 병렬화와 같은 기준)
+        max_workers = min(4, len(pdf_paths))
+
+    def _parse_one(pdf_path):
+        return USAParser(client).process(pdf_path)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_parse_one, pdf_paths))
@@ -13,6 +13,7 @@ OCR(텍스트 추출) 및 Vision API 모드를 지원하는 통합 관세 정보
 import os
 import re
 import argparse
+import logging
 import fitz  # PyMuPDF
 from dotenv import load_dotenv
 from openai import OpenAI
@@ -549,6 +550,9 @@ def main():
 
     args = parser.parse_args()
 
+    # 파서 모듈들의 logger.info 진행 메시지를 기존 print와 같은 형태로 출력
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     print("="*80)
     print("Tariff Information Extractor - Unified Version")
     print("="*80)